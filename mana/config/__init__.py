@@ -14,16 +14,53 @@ MANA_DIR = Path.home() / ".mana"
 MANA_DIR.mkdir(parents=True, exist_ok=True)
 
 FAISS_INDEX_FILE = MANA_DIR / "vectors.faiss"
-CHUNKS_FILE = MANA_DIR / "chunks.pkl"
+EMBEDDINGS_FILE = MANA_DIR / "embeddings.npy"  # Normalized fp32 vectors, one row per chunk
+CHUNKS_DIR = MANA_DIR / "chunks"  # Columnar chunk metadata, see rag/chunks.py
 METADATA_FILE = MANA_DIR / "metadata.json"
+NAME_CACHE_FILE = MANA_DIR / "name_cache.json"  # Parsed NAME descriptions by page hash
+NAME_CACHE_MIN_PAGES = 500  # Fewer pages parse faster than the name cache loads and saves
+QUERY_CACHE_FILE = MANA_DIR / "query_cache.json"  # Recent search results, see rag/query_cache.py
 
 # Embedding model configuration
 EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
 MAX_TEXT_LENGTH = 8000  # ~2000 tokens worth of text
+# Bytes of man page output to read; only the first MAX_TEXT_LENGTH characters are
+# embedded, so allow up to 4 bytes per character and drop the rest
+MAN_PAGE_READ_BYTES = MAX_TEXT_LENGTH * 4
+EMBEDDING_BATCH_SIZE = 128
+# Device for the embedding model ('cpu', 'cuda' or 'mps'); GPU devices run it in fp16
+EMBEDDING_DEVICE = 'cpu'
+# Threads for the embedding model's matrix math (OMP_NUM_THREADS above is kept at 1
+# for the other native libraries)
+EMBEDDING_THREADS = os.cpu_count() or 1
 
 # Indexing defaults
 DEFAULT_WORKERS = 8
 DEFAULT_TOP_K = 200
+# Store vectors as 8-bit scalar-quantized codes (4x smaller, slightly approximate scores);
+# the exact vectors are kept in EMBEDDINGS_FILE for rebuilds
+USE_INT8_INDEX = True
+# Indexes with at least this many vectors use an HNSW graph; smaller ones are brute-forced
+HNSW_MIN_VECTORS = 2000
+HNSW_M = 32  # Graph neighbors per node
+HNSW_EF_CONSTRUCTION = 40
+HNSW_EF_SEARCH = 16  # FAISS widens this to top_k when top_k is larger
+# OpenMP threads FAISS uses for search
+SEARCH_THREADS = max(1, (os.cpu_count() or 2) // 2)
+# Searches whose results are kept on disk between runs (dropped when the index changes)
+QUERY_CACHE_MAX_ENTRIES = 100
+# Programs handed to each indexing worker per task
+PROGRAM_BATCH_SIZE = 32
+# Threads used to stat man page files when checking the index for changes
+MANIFEST_STAT_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
+# TUI
+SEARCH_CACHE_SIZE = 128  # Recent searches whose results the TUI keeps in memory
+# Pause in typing a query after which the TUI starts searching it ahead of Enter
+SEARCH_DEBOUNCE_SECONDS = 0.15
+# Wrap each frame in synchronized-output markers (DEC mode 2026) so terminals that
+# support them show it all at once; others ignore the markers
+SYNCHRONIZED_OUTPUT = True
 
 # Man page sections to index
 # 1: User commands, 8: System admin commands
@@ -2,14 +2,23 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
-from typing import Set
+import os
+import threading
+from typing import Optional, Set
+
+try:
+    import orjson
+except ImportError:  # Optional, falls back to stdlib json
+    orjson = None
 
 from .config import MANA_DIR
 
 
 FAVORITES_FILE = MANA_DIR / "favorites.json"
 
+# Delay before writing changes, so rapid toggles coalesce into one write
+SAVE_DELAY = 0.5
+
 
 class FavoritesManager:
     """Manages favorite programs."""
@@ -17,36 +26,69 @@ class FavoritesManager:
     def __init__(self):
         """Initialize favorites manager."""
         self._favorites: Set[str] = set()
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
         self._load()
 
     def _load(self):
         """Load favorites from disk."""
         if FAVORITES_FILE.exists():
             try:
-                with open(FAVORITES_FILE, 'r') as f:
-                    data = json.load(f)
-                    self._favorites = set(data.get('favorites', []))
+                with open(FAVORITES_FILE, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson else json.loads(raw)
+                self._favorites = set(data.get('favorites', []))
             except Exception:
                 self._favorites = set()
 
     def _save(self):
-        """Save favorites to disk."""
+        """Save favorites to disk atomically."""
+        data = {'favorites': sorted(self._favorites)}
+        payload = orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8')
+        tmp_file = FAVORITES_FILE.with_suffix('.json.tmp')
         try:
             MANA_DIR.mkdir(parents=True, exist_ok=True)
-            with open(FAVORITES_FILE, 'w') as f:
-                json.dump({'favorites': sorted(self._favorites)}, f, indent=2)
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, FAVORITES_FILE)
         except Exception:
             pass
 
+    def _schedule_save(self):
+        """Mark favorites dirty and save after SAVE_DELAY unless already scheduled."""
+        with self._lock:
+            self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(SAVE_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        """Write pending changes to disk immediately."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._save()
+
     def add(self, program: str):
         """Add a program to favorites."""
-        self._favorites.add(program)
-        self._save()
+        with self._lock:
+            self._favorites.add(program)
+        self._schedule_save()
 
     def remove(self, program: str):
         """Remove a program from favorites."""
-        self._favorites.discard(program)
-        self._save()
+        with self._lock:
+            self._favorites.discard(program)
+        self._schedule_save()
 
     def toggle(self, program: str):
         """Toggle a program's favorite status."""
@@ -65,5 +107,6 @@ class FavoritesManager:
 
     def clear(self):
         """Clear all favorites."""
-        self._favorites.clear()
-        self._save()
+        with self._lock:
+            self._favorites.clear()
+        self._schedule_save()
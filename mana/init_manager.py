@@ -17,9 +17,9 @@ class InitStage(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True)
 class InitStatus:
-    """Current initialization status."""
+    """Current initialization status (immutable, replaced wholesale on update)."""
     stage: InitStage
     message: str
     current: int = 0
@@ -41,20 +41,19 @@ class InitializationManager:
         with self._lock:
             self._status_callbacks.append(callback)
     
+    # Readers don't lock: _status is an immutable InitStatus swapped by a single
+    # attribute assignment, so they always see a complete snapshot.
     def get_status(self) -> InitStatus:
         """Get current initialization status."""
-        with self._lock:
-            return self._status
+        return self._status
     
     def is_complete(self) -> bool:
         """Check if initialization is complete."""
-        with self._lock:
-            return self._status.stage == InitStage.COMPLETE
+        return self._status.stage == InitStage.COMPLETE
     
     def is_error(self) -> bool:
         """Check if there was an error."""
-        with self._lock:
-            return self._status.stage == InitStage.ERROR
+        return self._status.stage == InitStage.ERROR
     
     def mark_complete(self):
         """Mark initialization as complete (for when it's not needed)."""
@@ -62,14 +61,15 @@ class InitializationManager:
     
     def _update_status(self, stage: InitStage, message: str, current: int = 0, total: int = 0, error: Optional[str] = None):
         """Update status and notify callbacks."""
+        status = InitStatus(stage, message, current, total, error)
+        self._status = status
         with self._lock:
-            self._status = InitStatus(stage, message, current, total, error)
             callbacks = self._status_callbacks.copy()
         
         # Call callbacks outside lock to avoid deadlocks
         for callback in callbacks:
             try:
-                callback(self._status)
+                callback(status)
             except Exception:
                 pass  # Ignore callback errors
     
@@ -1,12 +1,23 @@
 """Man page processing utilities."""
 from __future__ import annotations
 
-from .parser import extract_name_section
-from .discovery import get_all_executables, process_program, discover_man_pages
+from .parser import extract_name_section, flush_name_cache
+from .discovery import (
+    get_all_executables,
+    process_program,
+    process_program_batch,
+    init_worker,
+    discover_man_pages,
+    scan_manifest,
+)
 
 __all__ = [
     'extract_name_section',
+    'flush_name_cache',
     'get_all_executables',
     'process_program',
+    'process_program_batch',
+    'init_worker',
     'discover_man_pages',
+    'scan_manifest',
 ]
@@ -1,15 +1,22 @@
 """Program discovery and man page fetching."""
 from __future__ import annotations
 
+import functools
 import gzip
 import os
+import signal
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple, Dict
 from pathlib import Path
 
+from ..config import MAN_PAGE_READ_BYTES, MANIFEST_STAT_THREADS
 
-def get_man_directories() -> List[Path]:
-    """Get list of man page directories from manpath."""
+
+@functools.lru_cache(maxsize=1)
+def get_man_directories() -> Tuple[Path, ...]:
+    """Get man page directories from manpath (cached for the process lifetime)."""
     try:
         result = subprocess.run(
             ['manpath'],
@@ -19,7 +26,7 @@ def get_man_directories() -> List[Path]:
             timeout=2
         )
         paths = result.stdout.strip().split(':')
-        return [Path(p) for p in paths if Path(p).exists()]
+        return tuple(Path(p) for p in paths if Path(p).exists())
     except Exception:
         # Fallback to common directories
         common_paths = [
@@ -27,7 +34,7 @@ def get_man_directories() -> List[Path]:
             Path('/usr/local/share/man'),
             Path('/opt/homebrew/share/man'),
         ]
-        return [p for p in common_paths if p.exists()]
+        return tuple(p for p in common_paths if p.exists())
 
 
 def read_man_file(file_path: Path) -> Optional[str]:
@@ -69,6 +76,9 @@ def read_man_file(file_path: Path) -> Optional[str]:
 def discover_man_pages(sections: List[str] = None) -> Dict[str, Path]:
     """Discover all available man pages by scanning man directories.
 
+    Results are cached per set of sections for the process lifetime; callers
+    must not mutate the returned dictionary.
+
     Args:
         sections: List of man sections to include (e.g., ['man1', 'man8']).
                   If None, uses default from config.
@@ -80,35 +90,41 @@ def discover_man_pages(sections: List[str] = None) -> Dict[str, Path]:
         from ..config import DEFAULT_SECTIONS
         sections = DEFAULT_SECTIONS
 
+    return _discover_man_pages(tuple(sections))
+
+
+@functools.lru_cache(maxsize=4)
+def _discover_man_pages(sections: Tuple[str, ...]) -> Dict[str, Path]:
+    """Scan man directories for the given sections (see discover_man_pages)."""
     man_dirs = get_man_directories()
     man_pages = {}
 
     for man_dir in man_dirs:
         # Check specified sections
         for section in sections:
-            section_dir = man_dir / section
-            if not section_dir.exists():
-                continue
+            section_dir = os.path.join(man_dir, section)
 
+            # scandir reuses d_type from getdents, so only symlinks need a stat
             try:
-                for man_file in section_dir.iterdir():
-                    if not man_file.is_file():
-                        continue
+                with os.scandir(section_dir) as entries:
+                    for entry in entries:
+                        if not entry.is_file():
+                            continue
 
-                    # Extract program name (remove .1.gz, .1, etc.)
-                    name = man_file.name
+                        # Extract program name (remove .1.gz, .1, etc.)
+                        name = entry.name
 
-                    # Remove compression extension
-                    if name.endswith('.gz'):
-                        name = name[:-3]
+                        # Remove compression extension
+                        if name.endswith('.gz'):
+                            name = name[:-3]
 
-                    # Remove section number (e.g., .1, .8)
-                    if '.' in name:
-                        name = name.rsplit('.', 1)[0]
+                        # Remove section number (e.g., .1, .8)
+                        if '.' in name:
+                            name = name.rsplit('.', 1)[0]
 
-                    # Skip if we already have this program (prefer earlier paths)
-                    if name not in man_pages:
-                        man_pages[name] = man_file
+                        # Skip if we already have this program (prefer earlier paths)
+                        if name not in man_pages:
+                            man_pages[name] = Path(entry.path)
 
             except (PermissionError, OSError):
                 continue
@@ -122,6 +138,24 @@ def get_all_executables() -> List[str]:
     return sorted(man_pages.keys())
 
 
+@functools.lru_cache(maxsize=1)
+def _man_env() -> Dict[str, str]:
+    """Environment for `man`, built once per process rather than per page."""
+    # Merge environment variables
+    env = os.environ.copy()
+    env['MANWIDTH'] = '200'  # Wide width to avoid excessive wrapping
+    env['MANPAGER'] = 'cat'  # Disable pager
+    return env
+
+
+def _signal_group(proc: subprocess.Popen, sig: int):
+    """Send a signal to a process started in its own session and its children."""
+    try:
+        os.killpg(proc.pid, sig)
+    except OSError:
+        pass
+
+
 def process_program(program: str, man_pages_cache: Optional[Dict[str, Path]] = None) -> Optional[Tuple[str, str]]:
     """Process a single program: read its man page.
 
@@ -141,24 +175,104 @@ def process_program(program: str, man_pages_cache: Optional[Dict[str, Path]] = N
 
     # Just run `man <program>` to get formatted output
     try:
-        # Merge environment variables
-        env = os.environ.copy()
-        env['MANWIDTH'] = '200'  # Wide width to avoid excessive wrapping
-        env['MANPAGER'] = 'cat'  # Disable pager
-
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ['man', program],
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
-            text=True,
-            timeout=5,
-            env=env
+            env=_man_env(),
+            start_new_session=True  # So the whole formatting pipeline can be signalled
         )
-
-        if result.returncode == 0 and result.stdout:
-            return (program, result.stdout)
+        # Kill man if it hangs, as the old subprocess.run timeout did
+        watchdog = threading.Timer(5, _signal_group, (proc, signal.SIGKILL))
+        watchdog.start()
+        try:
+            # Only the head of the page is used, so stop man once we have it
+            output = proc.stdout.read(MAN_PAGE_READ_BYTES)
+            truncated = len(output) == MAN_PAGE_READ_BYTES
+            if truncated:
+                _signal_group(proc, signal.SIGTERM)
+            proc.stdout.close()
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+
+        if output and (truncated or returncode == 0):
+            return (program, output.decode('utf-8', errors='ignore'))
 
     except Exception:
         pass
 
     return None
+
+
+# Man page map shared by pool workers, set once per process by init_worker
+_worker_man_pages: Optional[Dict[str, Path]] = None
+
+
+def init_worker(man_pages_cache: Dict[str, Path]):
+    """Pool initializer: store the man page map so it is not pickled per task.
+
+    Also builds the per-process state process_program reuses for every page.
+    """
+    global _worker_man_pages
+    _worker_man_pages = man_pages_cache
+    _man_env()
+
+
+def process_program_batch(programs: List[str]) -> List[Tuple[str, str]]:
+    """Process a batch of programs in a pool worker.
+
+    Uses the man page map installed by init_worker.
+
+    Returns:
+        List of (program_name, man_page_text) for programs that have a man page.
+    """
+    results = []
+    for program in programs:
+        result = process_program(program, _worker_man_pages)
+        if result:
+            results.append(result)
+    return results
+
+
+def _stat_or_none(path: Path) -> Optional[os.stat_result]:
+    """Stat a file, returning None if it has gone away."""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _stat_paths(paths: List[Path]) -> List[Optional[os.stat_result]]:
+    """Stat a slice of man page files (see _stat_or_none)."""
+    return [_stat_or_none(path) for path in paths]
+
+
+def scan_manifest(man_pages: Dict[str, Path]) -> Dict[str, List]:
+    """Stat man page files so an index update can tell which pages changed.
+
+    Args:
+        man_pages: Map of program -> man page path (from discover_man_pages)
+
+    Returns:
+        Dictionary mapping program name to [path, mtime_ns, size]
+    """
+    programs = list(man_pages)
+    paths = [man_pages[p] for p in programs]
+
+    # os.stat releases the GIL, so on a cold cache the stats can overlap; each thread
+    # takes one contiguous slice, as a task per page costs more than a warm stat
+    slice_size = max(1, -(-len(paths) // MANIFEST_STAT_THREADS))
+    slices = [paths[i:i + slice_size] for i in range(0, len(paths), slice_size)]
+    stats = []
+    if slices:
+        with ThreadPoolExecutor(max_workers=len(slices)) as executor:
+            for part in executor.map(_stat_paths, slices):
+                stats.extend(part)
+
+    manifest = {}
+    for program, path, st in zip(programs, paths, stats):
+        if st is not None:
+            manifest[program] = [str(path), st.st_mtime_ns, st.st_size]
+    return manifest
@@ -1,90 +1,173 @@
 """Man page parsing utilities."""
 from __future__ import annotations
 
-
-def extract_name_section(program: str, man_page_text: str) -> str:
-    """Extract the NAME section from a man page as the semantic summary."""
-    lines = man_page_text.split('\n')
+import atexit
+import hashlib
+import json
+import os
+import re
+from typing import Dict, List, Optional
+
+from ..config import NAME_CACHE_FILE
+
+# Overstrike sequences (char + backspace) used for bold/underline in formatted output
+_BACKSPACE_RE = re.compile(r'.\x08')
+
+# Body of an mdoc NAME section, up to the next .Sh
+_TROFF_NAME_RE = re.compile(r'^\.Sh NAME[ \t]*\n(.*?)(?=^\.Sh )', re.DOTALL | re.MULTILINE)
+
+# NAME header line in formatted output (plain or overstruck bold)
+_FORMATTED_NAME_RE = re.compile(r'^[ \t]*(?:NAME|N\x08NA\x08AM\x08ME\x08E)[ \t]*$\n?', re.MULTILINE)
+
+# NAME sections are a few lines long; never scan further than this past the header
+_MAX_NAME_LINES = 50
+
+# Least recently used entries are dropped past this, so pages that no longer exist age out
+_NAME_CACHE_MAX_ENTRIES = 50000
+
+# Descriptions keyed by a hash of program + page text, loaded on first use
+_name_cache: Optional[Dict[str, str]] = None
+_name_cache_dirty = False
+
+
+def _get_name_cache() -> Dict[str, str]:
+    """Load the on-disk name cache once per process."""
+    global _name_cache
+    if _name_cache is None:
+        try:
+            with open(NAME_CACHE_FILE, 'r', encoding='utf-8') as f:
+                _name_cache = json.load(f)
+        except Exception:
+            _name_cache = {}
+        atexit.register(flush_name_cache)
+    return _name_cache
+
+
+def flush_name_cache():
+    """Write new name cache entries to disk atomically."""
+    global _name_cache_dirty
+    if not _name_cache_dirty:
+        return
+
+    cache = _name_cache
+    overflow = len(cache) - _NAME_CACHE_MAX_ENTRIES
+    if overflow > 0:
+        for key in list(cache)[:overflow]:
+            del cache[key]
+
+    tmp_file = NAME_CACHE_FILE.with_suffix('.json.tmp')
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, NAME_CACHE_FILE)
+        _name_cache_dirty = False
+    except Exception:
+        pass
+
+
+def _troff_name_description(program: str, lines: List[str], in_name_section: bool = False) -> str:
+    """Collect the .Nd description from troff lines of (or containing) a NAME section."""
+    names = []
+    description_parts = []
+
+    for line in lines:
+        stripped = line.strip()
+
+        # Start of NAME section
+        if stripped == '.Sh NAME':
+            in_name_section = True
+            continue
+
+        # End of NAME section (next section)
+        if in_name_section and stripped.startswith('.Sh '):
+            break
+
+        if in_name_section:
+            # .Nm defines the name(s)
+            if stripped.startswith('.Nm'):
+                name = stripped[3:].strip()
+                if name and name != program:  # Skip if it's just repeating program name
+                    names.append(name)
+            # .Nd is the description
+            elif stripped.startswith('.Nd'):
+                description_parts.append(stripped[3:].strip())
+            # Lines without macros might be continuation
+            elif not stripped.startswith('.') and stripped:
+                description_parts.append(stripped)
+
+    return ' '.join(description_parts).strip()
+
+
+def _formatted_name_description(lines: List[str]) -> str:
+    """Collect the lines of a formatted NAME section, starting just after its header."""
+    name_lines = []
+
+    for line in lines:
+        stripped = line.strip()
+
+        # Stop at next section header (all caps) or empty line after content
+        if stripped and stripped.isupper() and len(stripped) > 3:
+            break
+        if stripped:
+            name_lines.append(stripped)
+        elif name_lines:  # Empty line after we've collected content
+            break
+
+    # Join and remove backspace characters
+    return _BACKSPACE_RE.sub('', ' '.join(name_lines).strip())
+
+
+def extract_name_section(program: str, man_page_text: str, use_cache: bool = True) -> str:
+    """Extract the NAME section from a man page as the semantic summary.
+
+    With use_cache, results are cached on disk by content, so unchanged pages are
+    not re-parsed on a rebuild.
+    """
+    global _name_cache_dirty
+    if not use_cache:
+        return _parse_name_section(program, man_page_text)
+
+    cache = _get_name_cache()
+    key = hashlib.blake2b(
+        f"{program}\0{man_page_text}".encode('utf-8', errors='ignore'), digest_size=16
+    ).hexdigest()
+
+    # Reinsert so the least recently used entries are first in line to be dropped
+    description = cache.pop(key, None)
+    if description is None:
+        description = _parse_name_section(program, man_page_text)
+    cache[key] = description
+    _name_cache_dirty = True
+    return description
+
+
+def _parse_name_section(program: str, man_page_text: str) -> str:
+    """Parse the NAME section out of man page text (uncached)."""
+    # Only the head is needed for format detection and the fallback
+    head_lines = man_page_text.split('\n', 20)[:20]
 
     # Check if this is raw troff format (starts with . commands)
-    is_troff = any(line.startswith('.') for line in lines[:20])
+    is_troff = any(line.startswith('.') for line in head_lines)
 
     if is_troff:
-        # Parse troff format (.Sh NAME, .Nm, .Nd)
-        in_name_section = False
-        names = []
-        description_parts = []
-
-        for line in lines:
-            stripped = line.strip()
-
-            # Start of NAME section
-            if stripped == '.Sh NAME':
-                in_name_section = True
-                continue
-
-            # End of NAME section (next section)
-            if in_name_section and stripped.startswith('.Sh '):
-                break
-
-            if in_name_section:
-                # .Nm defines the name(s)
-                if stripped.startswith('.Nm'):
-                    name = stripped[3:].strip()
-                    if name and name != program:  # Skip if it's just repeating program name
-                        names.append(name)
-                # .Nd is the description
-                elif stripped.startswith('.Nd'):
-                    description_parts.append(stripped[3:].strip())
-                # Lines without macros might be continuation
-                elif not stripped.startswith('.') and stripped:
-                    description_parts.append(stripped)
-
-        # Build description
-        if description_parts:
-            description = ' '.join(description_parts).strip()
+        # Parse troff format (.Sh NAME, .Nm, .Nd), tokenizing only the NAME block if found
+        match = _TROFF_NAME_RE.search(man_page_text)
+        if match:
+            description = _troff_name_description(program, match.group(1).splitlines(), in_name_section=True)
         else:
-            description = ''
+            description = _troff_name_description(program, man_page_text.splitlines())
     else:
-        # Parse formatted text (old behavior)
-        in_name_section = False
-        name_lines = []
-
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-
-            # Detect NAME section header
-            if stripped in ['NAME', 'N\x08NA\x08AM\x08ME\x08E']:
-                in_name_section = True
-                continue
-
-            # If we're in NAME section
-            if in_name_section:
-                # Stop at next section header (all caps) or empty line after content
-                if stripped and stripped.isupper() and len(stripped) > 3:
-                    break
-                if stripped:
-                    name_lines.append(stripped)
-                elif name_lines:  # Empty line after we've collected content
-                    break
-
-        # Join and clean up
-        description = ' '.join(name_lines).strip()
-
-        # Remove backspace characters
-        result = []
-        for char in description:
-            if char == '\x08':
-                if result:
-                    result.pop()
-            else:
-                result.append(char)
-
-        description = ''.join(result)
+        # Parse formatted text, starting from the NAME header if present
+        match = _FORMATTED_NAME_RE.search(man_page_text)
+        if match:
+            section_lines = man_page_text[match.end():].split('\n', _MAX_NAME_LINES)[:_MAX_NAME_LINES]
+            description = _formatted_name_description(section_lines)
+        else:
+            description = ''
 
     # Fallback: if no NAME section found, use first substantial line
     if not description:
-        for line in lines[:20]:
+        for line in head_lines:
             stripped = line.strip()
             if stripped and len(stripped) > 20 and not stripped.isupper():
                 description = stripped
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from .embeddings import get_embedding_model
 from .database import (
+    load_chunk_store,
     load_vector_database,
     save_vector_database,
     build_vector_database,
@@ -12,6 +13,7 @@ from .database import (
 
 __all__ = [
     'get_embedding_model',
+    'load_chunk_store',
     'load_vector_database',
     'save_vector_database',
     'build_vector_database',
@@ -0,0 +1,132 @@
+"""Columnar on-disk storage for chunk metadata."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+# String columns are stored as one utf-8 blob plus an offsets array per field
+STRING_FIELDS = ('program', 'semantic_summary', 'text')
+# Integer columns are stored as plain arrays
+COUNT_FIELDS = ('line_count', 'word_count', 'char_count')
+# Fields handed out with search results; the page text is left undecoded
+RESULT_FIELDS = ('program', 'semantic_summary')
+
+
+def _replace_file(path: Path, data: Union[bytes, np.ndarray]):
+    """Write a column file via a temp file, fsync and rename."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        if isinstance(data, np.ndarray):
+            np.save(f, data)
+        else:
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def empty_columns() -> Dict[str, List]:
+    """Create empty chunk columns to append to, one list per field."""
+    return {field: [] for field in STRING_FIELDS + COUNT_FIELDS}
+
+
+def concat_columns(*parts: Dict[str, Sequence]) -> Dict[str, Sequence]:
+    """Concatenate chunk columns row-wise."""
+    columns = {field: [value for part in parts for value in part[field]] for field in STRING_FIELDS}
+    for field in COUNT_FIELDS:
+        columns[field] = np.concatenate([np.asarray(part[field], dtype=np.int32) for part in parts])
+    return columns
+
+
+def save_chunk_store(columns: Dict[str, Sequence], directory: Path):
+    """Save chunk columns (every field in STRING_FIELDS and COUNT_FIELDS) into directory."""
+    directory.mkdir(parents=True, exist_ok=True)
+
+    for field in STRING_FIELDS:
+        encoded = [value.encode('utf-8') for value in columns[field]]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        _replace_file(directory / f"{field}.bin", b''.join(encoded))
+        _replace_file(directory / f"{field}_offsets.npy", offsets)
+
+    for field in COUNT_FIELDS:
+        _replace_file(directory / f"{field}.npy", np.asarray(columns[field], dtype=np.int32))
+
+
+class ChunkStore:
+    """Read-only view of a saved chunk store.
+
+    Column files are memory-mapped, so loading is near-instant and a chunk's
+    fields are only decoded when that chunk is accessed. Indexing returns a
+    new dict of that chunk's fields each time.
+    """
+
+    def __init__(self, directory: Path):
+        self._blobs = {}
+        self._offsets = {}
+        for field in STRING_FIELDS:
+            blob_file = directory / f"{field}.bin"
+            # np.memmap can't map an empty file
+            if blob_file.stat().st_size:
+                self._blobs[field] = np.memmap(blob_file, dtype=np.uint8, mode='r')
+            else:
+                self._blobs[field] = np.zeros(0, dtype=np.uint8)
+            self._offsets[field] = np.load(directory / f"{field}_offsets.npy", mmap_mode='r')
+
+        self._counts = {
+            field: np.load(directory / f"{field}.npy", mmap_mode='r')
+            for field in COUNT_FIELDS
+        }
+        self._length = len(self._offsets['program']) - 1
+        self._program_rows = None
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        for i in range(self._length):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> Dict[str, str]:
+        if not 0 <= i < self._length:
+            raise IndexError(f"chunk index {i} out of range")
+        chunk = {field: self.get_field(i, field) for field in STRING_FIELDS}
+        for field in COUNT_FIELDS:
+            chunk[field] = int(self._counts[field][i])
+        return chunk
+
+    def get_fields(self, i: int, fields: Sequence[str] = RESULT_FIELDS) -> Dict[str, str]:
+        """Decode only the given string fields of chunk i into a new dict."""
+        if not 0 <= i < self._length:
+            raise IndexError(f"chunk index {i} out of range")
+        return {field: self.get_field(i, field) for field in fields}
+
+    def get_field(self, i: int, field: str) -> str:
+        """Decode a single string field of chunk i."""
+        offsets = self._offsets[field]
+        return self._blobs[field][offsets[i]:offsets[i + 1]].tobytes().decode('utf-8')
+
+    def columns(
+        self,
+        rows: Optional[np.ndarray] = None,
+        fields: Sequence[str] = STRING_FIELDS + COUNT_FIELDS
+    ) -> Dict[str, Sequence]:
+        """Decode whole columns, optionally only the given rows and fields."""
+        if rows is None:
+            rows = np.arange(self._length)
+        columns = {}
+        for field in fields:
+            if field in self._counts:
+                columns[field] = np.array(self._counts[field][rows])
+            else:
+                columns[field] = [self.get_field(i, field) for i in rows]
+        return columns
+
+    def program_rows(self) -> Dict[str, int]:
+        """Map each program name to its row, built on first use."""
+        if self._program_rows is None:
+            self._program_rows = {self.get_field(i, 'program'): i for i in range(self._length)}
+        return self._program_rows
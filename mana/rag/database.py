@@ -2,38 +2,109 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 import os
-import pickle
 import sys
-from typing import List, Dict, Optional, Tuple, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import TYPE_CHECKING, List, Dict, Optional, Sequence, Tuple, Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
 
-import numpy as np
-import faiss
+try:
+    import orjson
+except ImportError:  # Optional, falls back to stdlib json
+    orjson = None
 
 from ..config import (
     FAISS_INDEX_FILE,
-    CHUNKS_FILE,
+    EMBEDDINGS_FILE,
+    CHUNKS_DIR,
     METADATA_FILE,
+    NAME_CACHE_MIN_PAGES,
     MAX_TEXT_LENGTH,
+    EMBEDDING_BATCH_SIZE,
     DEFAULT_WORKERS,
+    PROGRAM_BATCH_SIZE,
+    SEARCH_THREADS,
+    USE_INT8_INDEX,
+    HNSW_MIN_VECTORS,
+    HNSW_M,
+    HNSW_EF_CONSTRUCTION,
+    HNSW_EF_SEARCH,
+)
+from ..manpage import (
+    process_program_batch,
+    init_worker,
+    get_all_executables,
+    extract_name_section,
+    flush_name_cache,
+    discover_man_pages,
+    scan_manifest,
 )
-from ..manpage import process_program, get_all_executables, extract_name_section, discover_man_pages
 from .embeddings import get_embedding_model
+from .query_cache import get_cached_results, cache_results
+
+# numpy, FAISS and the chunk store (numpy-backed) are imported where they are used,
+# so importing this module stays cheap for commands that never touch the index
+if TYPE_CHECKING:
+    import faiss
+    import numpy as np
+    from .chunks import ChunkStore
+
+
+def _import_faiss():
+    """Import FAISS on first use."""
+    import faiss
+
+    # FAISS may not use every core by default; half leaves room for the TUI and embedder
+    faiss.omp_set_num_threads(SEARCH_THREADS)
+    return faiss
+
+
+def _worker_context():
+    """Multiprocessing context for the indexing pool.
+
+    Indexing may run on a background thread (e.g. under the TUI), and forking a
+    process that has threads can deadlock the child, so use a forkserver where
+    the platform has one.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context()
+
+
+def load_chunk_store() -> Optional[ChunkStore]:
+    """Load the memory-mapped chunk store from disk."""
+    if not CHUNKS_DIR.exists():
+        return None
+
+    from .chunks import ChunkStore
+
+    try:
+        return ChunkStore(CHUNKS_DIR)
+    except Exception as e:
+        print(f"Error loading chunks: {e}")
+        return None
 
 
-def load_vector_database() -> Optional[Tuple[faiss.Index, List[Dict[str, str]]]]:
+def load_vector_database() -> Optional[Tuple[faiss.Index, ChunkStore]]:
     """Load the FAISS index and chunks from disk."""
-    if not FAISS_INDEX_FILE.exists() or not CHUNKS_FILE.exists():
+    if not FAISS_INDEX_FILE.exists() or not CHUNKS_DIR.exists():
         return None
 
+    faiss = _import_faiss()
+    from .chunks import ChunkStore
+
     try:
-        # Load FAISS index
-        index = faiss.read_index(str(FAISS_INDEX_FILE))
+        # Memory-map the index's vectors (IO_FLAG_MMAP_IFC, faiss >= 1.8) so only pages
+        # a search touches are read; searches never modify the loaded index
+        mmap_flag = getattr(faiss, 'IO_FLAG_MMAP_IFC', faiss.IO_FLAG_MMAP)
+        index = faiss.read_index(str(FAISS_INDEX_FILE), mmap_flag | faiss.IO_FLAG_READ_ONLY)
+        if hasattr(index, 'hnsw'):
+            index.hnsw.efSearch = HNSW_EF_SEARCH
 
-        # Load chunks
-        with open(CHUNKS_FILE, 'rb') as f:
-            chunks = pickle.load(f)
+        # Map chunks (fields are decoded lazily on access)
+        chunks = ChunkStore(CHUNKS_DIR)
 
         return index, chunks
     except Exception as e:
@@ -41,52 +112,154 @@ def load_vector_database() -> Optional[Tuple[faiss.Index, List[Dict[str, str]]]]
         return None
 
 
-def get_indexed_programs() -> List[str]:
-    """Get list of already indexed programs from metadata."""
+def load_embeddings(index: faiss.Index) -> np.ndarray:
+    """Load the saved embedding matrix (memory-mapped, read-only).
+
+    Indexes saved without the embeddings file have their vectors reconstructed
+    (8-bit ones approximately).
+    """
+    import numpy as np
+
+    if EMBEDDINGS_FILE.exists():
+        embeddings = np.load(EMBEDDINGS_FILE, mmap_mode='r')
+        if embeddings.shape == (index.ntotal, index.d):
+            return embeddings
+    return index.reconstruct_n(0, index.ntotal)
+
+
+def get_index_metadata() -> Dict:
+    """Get metadata about the saved index (program list, man page manifest, ...)."""
     if not METADATA_FILE.exists():
-        return []
+        return {}
 
     try:
-        with open(METADATA_FILE) as f:
-            metadata = json.load(f)
-            return metadata.get("programs", [])
+        with open(METADATA_FILE, 'rb') as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson else json.loads(raw)
     except Exception:
-        return []
+        return {}
+
+
+def get_indexed_programs() -> List[str]:
+    """Get list of already indexed programs from metadata."""
+    return get_index_metadata().get("programs", [])
+
+
+def _fsync_path(path: Path):
+    """Flush a file written by a library to disk before it is renamed into place."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _saved_database_exists() -> bool:
+    """Whether the index files the metadata describes are on disk and loadable."""
+    if FAISS_INDEX_FILE.exists() and EMBEDDINGS_FILE.exists() and CHUNKS_DIR.exists():
+        return True
+    return load_vector_database() is not None
+
+
+def write_index_metadata(metadata: Dict):
+    """Write index metadata atomically (temp file, fsync, rename)."""
+    if orjson:
+        payload = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(metadata, indent=2).encode('utf-8')
+    tmp_file = METADATA_FILE.with_name(METADATA_FILE.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, METADATA_FILE)
+
+
+def create_index(dimension: int, num_vectors: int) -> faiss.Index:
+    """Create an empty inner-product index suited to the number of vectors."""
+    faiss = _import_faiss()
+
+    if num_vectors >= HNSW_MIN_VECTORS:
+        # Approximate graph search; brute force is faster on small corpora
+        if USE_INT8_INDEX:
+            index = faiss.IndexHNSWSQ(dimension, faiss.ScalarQuantizer.QT_8bit, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        else:
+            index = faiss.IndexHNSWFlat(dimension, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = HNSW_EF_SEARCH
+        return index
+
+    if USE_INT8_INDEX:
+        # 8-bit scalar quantization: 4x smaller, trained per-dimension ranges
+        return faiss.IndexScalarQuantizer(dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT)
+    return faiss.IndexFlatIP(dimension)
 
 
 def save_vector_database(
-    chunks: List[Dict[str, str]],
+    chunks: Dict[str, Sequence],
     embeddings: np.ndarray,
-    programs: List[str]
+    programs: List[str],
+    manifest: Optional[Dict[str, List]] = None,
+    base_index: Optional[faiss.Index] = None
 ):
-    """Save the FAISS index and chunks to disk."""
-    # Create FAISS index (L2 distance, normalized for cosine similarity)
-    dimension = embeddings.shape[1]
-    index = faiss.IndexFlatL2(dimension)
+    """Save the FAISS index and chunks to disk.
 
-    # Normalize vectors for cosine similarity
-    faiss.normalize_L2(embeddings)
-    index.add(embeddings)
-
-    # Save FAISS index
-    faiss.write_index(index, str(FAISS_INDEX_FILE))
+    Args:
+        chunks: Chunk columns (see rag/chunks.py), one row per row of embeddings
+        embeddings: L2-normalized embedding matrix
+        programs: Indexed program names
+        manifest: Optional map of program -> [path, mtime_ns, size] of its man page,
+                  used by incremental updates to detect changed pages
+        base_index: Optional writable index holding the leading rows of embeddings;
+                    if it is the kind of index that would be built anyway, only the
+                    remaining rows are added to it
+    """
+    import numpy as np
+    from .chunks import save_chunk_store
+    faiss = _import_faiss()
 
-    # Save chunks as pickle (more efficient than JSON)
-    with open(CHUNKS_FILE, 'wb') as f:
-        pickle.dump(chunks, f)
+    # Create FAISS index (inner product on normalized vectors = cosine similarity)
+    dimension = embeddings.shape[1]
+    index = create_index(dimension, len(embeddings))
+    if (base_index is not None and type(base_index) is type(index)
+            and base_index.d == dimension and base_index.ntotal <= len(embeddings)):
+        # Append to the existing index (keeping e.g. its HNSW graph) instead of rebuilding it
+        index = base_index
+
+    # Vectors are normalized by the model at encode time, so no renormalization pass here
+    if not index.is_trained:
+        index.train(embeddings)
+    index.add(embeddings[index.ntotal:])
+
+    # Save FAISS index to a new file, as loaded indexes may still be mapping the old one
+    tmp_file = FAISS_INDEX_FILE.with_name(FAISS_INDEX_FILE.name + '.tmp')
+    faiss.write_index(index, str(tmp_file))
+    _fsync_path(tmp_file)
+    os.replace(tmp_file, FAISS_INDEX_FILE)
+
+    # Keep the exact vectors alongside, so updates don't have to pull them back out of the index
+    tmp_file = EMBEDDINGS_FILE.with_name(EMBEDDINGS_FILE.name + '.tmp')
+    with open(tmp_file, 'wb') as f:
+        np.save(f, embeddings)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, EMBEDDINGS_FILE)
+
+    # Save chunks column by column so loading can memory-map them
+    save_chunk_store(chunks, CHUNKS_DIR)
 
     # Save metadata with program list
     metadata = {
-        "num_chunks": len(chunks),
+        "num_chunks": len(chunks['program']),
         "num_programs": len(programs),
         "dimension": dimension,
-        "indexed_at": os.popen('date').read().strip(),
-        "programs": sorted(programs)
+        "indexed_at": datetime.now().astimezone().isoformat(timespec='seconds'),
+        "programs": sorted(programs),
+        "manifest": manifest or {},
     }
-    with open(METADATA_FILE, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    write_index_metadata(metadata)
 
-    print(f"✓ Saved {len(chunks)} chunks to FAISS index at {FAISS_INDEX_FILE}")
+    print(f"✓ Saved {len(chunks['program'])} chunks to FAISS index at {FAISS_INDEX_FILE}")
 
 
 def build_vector_database(
@@ -105,6 +278,9 @@ def build_vector_database(
         force: Force full reindex, ignoring existing data.
         progress_callback: Optional callback function(stage, current, total, message) for progress updates.
     """
+    import numpy as np
+    from .chunks import empty_columns, concat_columns
+
     if programs is None:
         programs = get_all_executables()
         if progress_callback:
@@ -112,83 +288,113 @@ def build_vector_database(
         elif verbose:
             print(f"Found {len(programs)} unique executables")
 
+    # Discover all man pages once (much faster than checking per program)
+    if verbose and not progress_callback:
+        print(f"\nDiscovering man page files...")
+    man_pages_cache = discover_man_pages()
+    if verbose and not progress_callback:
+        print(f"  Found {len(man_pages_cache)} man pages")
+
+    # Stat every page so unchanged ones are skipped without being read
+    manifest = scan_manifest(man_pages_cache)
+
     # Check for existing index and do incremental update if not forcing
     existing_programs = []
-    existing_chunks = []
+    existing_chunks = empty_columns()
     existing_embeddings = None
+    base_index = None
     if not force:
-        existing_programs = get_indexed_programs()
+        metadata = get_index_metadata()
+        existing_programs = metadata.get("programs", [])
+        if existing_programs and not _saved_database_exists():
+            # Metadata without a loadable database (e.g. from the old chunks.pkl
+            # layout): index everything again
+            existing_programs = []
         if existing_programs:
-            # Load existing chunks and index
-            db = load_vector_database()
-            if db:
-                existing_index, existing_chunks = db
-                # Extract embeddings from FAISS index
-                # IndexFlatL2 stores vectors directly, so we can reconstruct them
-                try:
-                    existing_embeddings = np.zeros((existing_index.ntotal, existing_index.d), dtype=np.float32)
-                    for i in range(existing_index.ntotal):
-                        existing_embeddings[i] = existing_index.reconstruct(i)
-                except Exception as e:
-                    # If reconstruction fails, we'll re-embed everything
-                    existing_embeddings = None
-                    if verbose:
-                        print(f"Warning: Could not extract existing embeddings: {e}")
-
-            # Compute diff
+            # Compute diff; pages modified since they were indexed are replaced
+            previous_manifest = metadata.get("manifest", {})
             programs_set = set(programs)
             existing_set = set(existing_programs)
-            new_programs = sorted(programs_set - existing_set)
-            removed_programs = sorted(existing_set - programs_set)
+            changed_programs = {
+                p for p in existing_set & programs_set
+                if p in previous_manifest and previous_manifest[p] != manifest.get(p)
+            }
+            new_programs = sorted((programs_set - existing_set) | changed_programs)
+            removed_programs = sorted((existing_set - programs_set) | changed_programs)
+            up_to_date = not new_programs and not removed_programs
 
             if not progress_callback and verbose:
                 print(f"  Already indexed: {len(existing_programs)} programs")
-                if removed_programs:
-                    print(f"  Removed from PATH: {len(removed_programs)} programs")
-                if new_programs:
-                    print(f"  New to index: {len(new_programs)} programs")
-                else:
+                if changed_programs:
+                    print(f"  Changed man pages: {len(changed_programs)} programs")
+                if existing_set - programs_set:
+                    print(f"  Removed from PATH: {len(existing_set - programs_set)} programs")
+                if programs_set - existing_set:
+                    print(f"  New to index: {len(programs_set - existing_set)} programs")
+                if up_to_date:
                     print(f"  No new programs to index!")
-                    if not removed_programs:
-                        return
-            elif not new_programs and not removed_programs:
-                # No new programs and nothing removed - database is up to date
+
+            if up_to_date:
+                # Indexes saved before manifests existed get one recorded now
+                if "manifest" not in metadata:
+                    metadata["manifest"] = {p: manifest[p] for p in existing_programs if p in manifest}
+                    write_index_metadata(metadata)
                 if progress_callback:
                     progress_callback("complete", len(existing_programs), len(existing_programs), "Database is up to date")
                 return
 
-            # Only process new programs
-            programs = new_programs
-
-            # Filter out chunks from removed programs and their embeddings
-            if removed_programs:
-                removed_set = set(removed_programs)
-                # Build mapping to keep track of indices
-                filtered_chunks = []
-                filtered_embeddings = []
-                for i, chunk in enumerate(existing_chunks):
-                    if chunk.get('program') not in removed_set:
-                        filtered_chunks.append(chunk)
-                        if existing_embeddings is not None:
-                            filtered_embeddings.append(existing_embeddings[i])
-                
-                existing_chunks = filtered_chunks
-                if filtered_embeddings:
-                    existing_embeddings = np.array(filtered_embeddings)
-                else:
+            # Load existing chunks and index only once we know something changed
+            db = load_vector_database()
+            if not db:
+                # Metadata without a loadable database: index everything again
+                existing_programs = []
+            else:
+                existing_index, chunk_store = db
+                try:
+                    existing_embeddings = load_embeddings(existing_index)
+                except Exception as e:
+                    # If the vectors can't be recovered, we'll re-embed everything
                     existing_embeddings = None
-                existing_programs = [p for p in existing_programs if p not in removed_set]
-                
-                # If we only removed programs (no new ones), save the updated database
-                if not programs and existing_embeddings is not None:
-                    if progress_callback:
-                        progress_callback("saving", 0, 1, f"Removing {len(removed_programs)} programs from database...")
-                    save_vector_database(existing_chunks, existing_embeddings, existing_programs)
-                    if progress_callback:
-                        progress_callback("complete", len(existing_programs), len(existing_programs), f"Removed {len(removed_programs)} programs")
-                    elif verbose:
-                        print(f"✓ Removed {len(removed_programs)} programs from database")
-                    return
+                    if verbose:
+                        print(f"Warning: Could not extract existing embeddings: {e}")
+
+                # With nothing removed every saved vector is kept, so the index can be
+                # extended; load a writable copy (the one above is memory-mapped read-only)
+                if not removed_programs and existing_embeddings is not None:
+                    base_index = _import_faiss().read_index(str(FAISS_INDEX_FILE))
+
+                # Only process new programs
+                programs = new_programs
+
+                # Keep chunks of unchanged programs; one mask selects their rows and embeddings
+                program_column = chunk_store.columns(fields=('program',))['program']
+                keep_mask = ~np.isin(program_column, removed_programs)
+                existing_chunks = chunk_store.columns(np.flatnonzero(keep_mask))
+
+                # Filter out embeddings of removed programs
+                if removed_programs:
+                    removed_set = set(removed_programs)
+                    if existing_embeddings is not None and keep_mask.any():
+                        existing_embeddings = existing_embeddings[keep_mask]
+                    else:
+                        existing_embeddings = None
+                    existing_programs = [p for p in existing_programs if p not in removed_set]
+
+                    # If we only removed programs (no new ones), save the updated database
+                    if not programs and existing_embeddings is not None:
+                        if progress_callback:
+                            progress_callback("saving", 0, 1, f"Removing {len(removed_programs)} programs from database...")
+                        save_vector_database(
+                            existing_chunks,
+                            existing_embeddings,
+                            existing_programs,
+                            {p: manifest[p] for p in existing_programs if p in manifest}
+                        )
+                        if progress_callback:
+                            progress_callback("complete", len(existing_programs), len(existing_programs), f"Removed {len(removed_programs)} programs")
+                        elif verbose:
+                            print(f"✓ Removed {len(removed_programs)} programs from database")
+                        return
 
     if not programs:
         if not progress_callback:
@@ -197,30 +403,28 @@ def build_vector_database(
 
     new_man_pages = {}  # program -> man_page_text
     new_programs = []
-    # Discover all man pages once (much faster than checking per program)
-    if verbose and not progress_callback:
-        print(f"\nDiscovering man page files...")
-    man_pages_cache = discover_man_pages()
-    if verbose and not progress_callback:
-        print(f"  Found {len(man_pages_cache)} man pages")
 
-    # Process programs in parallel - just read man pages
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks with the cache
-        future_to_program = {executor.submit(process_program, prog, man_pages_cache): prog for prog in programs}
+    # Process programs in parallel worker processes, in batches to amortize task overhead.
+    # The man page map is handed to each worker once via the initializer.
+    batches = [programs[i:i + PROGRAM_BATCH_SIZE] for i in range(0, len(programs), PROGRAM_BATCH_SIZE)]
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=_worker_context(),
+        initializer=init_worker,
+        initargs=(man_pages_cache,)
+    ) as executor:
+        future_to_batch = {executor.submit(process_program_batch, batch): batch for batch in batches}
 
         # Process results as they complete
         if verbose and not progress_callback:
             print(f"\nDiscovering programs with man pages (workers={max_workers})...")
 
         completed = 0
-        for future in as_completed(future_to_program):
-            result = future.result()
-            if result:
-                program, man_page = result
+        for future in as_completed(future_to_batch):
+            for program, man_page in future.result():
                 new_man_pages[program] = man_page
                 new_programs.append(program)
-            completed += 1
+            completed += len(future_to_batch[future])
 
             if progress_callback:
                 progress_callback("scanning", completed, len(programs), f"Found {len(new_programs)} with man pages")
@@ -232,69 +436,95 @@ def build_vector_database(
             sys.stdout.write(f'\r  [{len(programs)}/{len(programs)}] Done!{" " * 50}\n')
             sys.stdout.flush()
 
-    if not new_man_pages and not existing_chunks:
+    if not new_man_pages and not existing_chunks['program']:
         if not progress_callback:
             print("\nNo programs to index!")
         return
 
     # Extract NAME sections for display, but use full man page for embedding
-    new_chunks = []
+    new_chunks = empty_columns()
     if new_man_pages:
         if verbose and not progress_callback:
             print(f"\nProcessing {len(new_man_pages)} programs...")
 
+        use_name_cache = len(new_man_pages) >= NAME_CACHE_MIN_PAGES
         for idx, (program, man_page) in enumerate(new_man_pages.items(), 1):
             # Extract NAME section for display
-            name_description = extract_name_section(program, man_page)
+            name_description = extract_name_section(program, man_page, use_cache=use_name_cache)
 
-            # Calculate man page stats
-            line_count = len(man_page.split('\n'))
+            # Calculate man page stats (count newlines rather than building a list of lines)
+            line_count = man_page.count('\n') + 1
             word_count = len(man_page.split())
             char_count = len(man_page)
 
-            # Create single chunk per program
-            new_chunks.append({
-                "program": program,
-                "text": man_page,  # Keep full man page for embedding
-                "semantic_summary": name_description,  # But display the NAME section
-                "line_count": line_count,
-                "word_count": word_count,
-                "char_count": char_count,
-            })
+            # Create single chunk per program, one value per column
+            new_chunks["program"].append(program)
+            new_chunks["text"].append(man_page[:MAX_TEXT_LENGTH])  # Only this much is ever embedded
+            new_chunks["semantic_summary"].append(name_description)  # But display the NAME section
+            new_chunks["line_count"].append(line_count)
+            new_chunks["word_count"].append(word_count)
+            new_chunks["char_count"].append(char_count)
 
             if progress_callback:
                 progress_callback("extracting", idx, len(new_man_pages), f"Processing man pages")
 
+        flush_name_cache()
+
         if verbose and not progress_callback:
             print(f"  Done!")
 
     # Embed only NEW man pages, not existing ones
-    if new_chunks:
-        # Truncate to reasonable length to avoid token limits (most models have ~512 token limit)
-        texts_to_embed = [c["text"][:MAX_TEXT_LENGTH] for c in new_chunks]
+    num_new = len(new_chunks["program"])
+    if num_new:
         if verbose and not progress_callback:
-            print(f"\nEmbedding {len(new_chunks)} new man pages...")
+            print(f"\nEmbedding {num_new} new man pages...")
         # Lazy load embedding model only when needed
         embedding_model = get_embedding_model()
+
+        # The model only reads its first max_seq_length tokens, and every word is at least
+        # one token, so cut each page to that many words (with whitespace runs collapsed,
+        # which the tokenizer ignores) before handing it to the tokenizer
+        max_words = embedding_model.max_seq_length
+        texts_to_embed = [
+            ' '.join(text.split(maxsplit=max_words)[:max_words])
+            for text in new_chunks["text"]
+        ]
         # For progress tracking: encode in batches to update progress
         if progress_callback:
-            batch_size = 32  # Process in batches for progress updates
-            embeddings_list = []
+            batch_size = EMBEDDING_BATCH_SIZE  # Process in batches for progress updates
+            # encode() sorts by length to minimize padding, but only within one call;
+            # sort the whole set up front so every batch is of similar lengths
+            order = np.argsort([-len(text) for text in texts_to_embed], kind='stable')
+            # Each batch is written straight to its rows, so there's no stacking copy at the end
+            new_embeddings = np.empty(
+                (len(texts_to_embed), embedding_model.get_sentence_embedding_dimension()),
+                dtype=np.float32
+            )
             for i in range(0, len(texts_to_embed), batch_size):
-                batch = texts_to_embed[i:i + batch_size]
-                batch_embeddings = embedding_model.encode(batch, convert_to_numpy=True, show_progress_bar=False)
-                embeddings_list.append(batch_embeddings)
-                progress_callback("embedding", min(i + batch_size, len(texts_to_embed)), len(new_chunks), f"Embedding {min(i + batch_size, len(texts_to_embed))}/{len(new_chunks)} new man pages")
-            new_embeddings = np.vstack(embeddings_list)
+                batch_rows = order[i:i + batch_size]
+                new_embeddings[batch_rows] = embedding_model.encode(
+                    [texts_to_embed[j] for j in batch_rows],
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                )
+                progress_callback("embedding", min(i + batch_size, len(texts_to_embed)), num_new, f"Embedding {min(i + batch_size, len(texts_to_embed))}/{num_new} new man pages")
         else:
-            new_embeddings = embedding_model.encode(texts_to_embed, convert_to_numpy=True, show_progress_bar=False)
+            new_embeddings = embedding_model.encode(
+                texts_to_embed,
+                batch_size=EMBEDDING_BATCH_SIZE,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
         if verbose and not progress_callback:
             print(f"  Done!")
     else:
         new_embeddings = np.array([]).reshape(0, existing_embeddings.shape[1] if existing_embeddings is not None else 384)
 
     # Merge chunks and embeddings
-    all_chunks = existing_chunks + new_chunks
+    all_chunks = concat_columns(existing_chunks, new_chunks)
     all_programs = sorted(set(existing_programs + new_programs))
     
     # Concatenate embeddings
@@ -310,11 +540,17 @@ def build_vector_database(
         if new_programs:
             print(f"\n✓ Generated summaries for {len(new_programs)} new programs")
         print(f"  Total programs: {len(all_programs)}")
-        print(f"  Total chunks: {len(all_chunks)}")
+        print(f"  Total chunks: {len(all_chunks['program'])}")
 
     if progress_callback:
         progress_callback("saving", 0, 1, "Saving to disk...")
-    save_vector_database(all_chunks, all_embeddings, all_programs)
+    save_vector_database(
+        all_chunks,
+        all_embeddings,
+        all_programs,
+        {p: manifest[p] for p in all_programs if p in manifest},
+        base_index
+    )
     if progress_callback:
         progress_callback("complete", len(all_programs), len(all_programs), f"Indexed {len(all_programs)} programs")
     elif verbose:
@@ -323,16 +559,23 @@ def build_vector_database(
         print(f"✓ Total: {len(all_programs)} programs indexed")
 
 
-def search_vector_database(query: str, top_k: int = 200) -> List[Dict[str, str]]:
+def search_vector_database(query: str, top_k: int = 200, persist: bool = True) -> List[Dict[str, str]]:
     """Search using FAISS semantic similarity.
 
     Args:
         query: Search query string
         top_k: Number of top results to return
+        persist: Save the results in the on-disk query cache; pass False for
+                 searches that aren't finished queries (e.g. typing-pause prefetches)
 
     Returns:
-        List of matching programs with similarity scores
+        List of matching programs (program, semantic_summary) with similarity scores
     """
+    # Results for a query only change when the index does
+    cached = get_cached_results(query, top_k, persist)
+    if cached is not None:
+        return cached
+
     result = load_vector_database()
 
     if not result:
@@ -340,13 +583,16 @@ def search_vector_database(query: str, top_k: int = 200) -> List[Dict[str, str]]
         return []
 
     index, chunks = result
+    faiss = _import_faiss()
 
     # Semantic search with FAISS
     # Lazy load embedding model only when searching
     model = get_embedding_model()
-    query_embedding = model.encode(query, convert_to_numpy=True)
+    query_embedding = model.encode(query, convert_to_numpy=True, normalize_embeddings=True)
     query_embedding = query_embedding.reshape(1, -1)
-    faiss.normalize_L2(query_embedding)
+
+    # Indexes built before the switch to IndexFlatIP return squared L2 distances
+    is_l2_index = index.metric_type == faiss.METRIC_L2
 
     # Limit top_k to actual number of chunks available
     actual_top_k = min(top_k, len(chunks))
@@ -354,13 +600,17 @@ def search_vector_database(query: str, top_k: int = 200) -> List[Dict[str, str]]
     # Search for top-k matches (fast!)
     distances, indices = index.search(query_embedding, actual_top_k)
 
-    # Return chunks with similarity scores
+    # Convert scores and drop missing hits (-1 ids) in one pass over the arrays
+    ids = indices[0]
+    similarities = 1 - distances[0] / 2 if is_l2_index else distances[0]
+    valid = (ids >= 0) & (ids < len(chunks))
+
+    # Return small result dicts with similarity scores (the page text isn't decoded)
     result_chunks = []
-    for idx, dist in zip(indices[0], distances[0]):
-        if idx < len(chunks):
-            chunk = chunks[idx].copy()
-            # Convert L2 distance to similarity score (0-1)
-            chunk['similarity'] = 1 - (dist / 2)
-            result_chunks.append(chunk)
+    for idx, similarity in zip(ids[valid].tolist(), similarities[valid].tolist()):
+        chunk = chunks.get_fields(idx)
+        chunk['similarity'] = similarity
+        result_chunks.append(chunk)
 
+    cache_results(query, top_k, result_chunks, persist)
     return result_chunks
@@ -1,10 +1,9 @@
 """Embedding model management."""
 from __future__ import annotations
 
-from typing import Optional
 from typing import Optional, Any
 
-from ..config import EMBEDDING_MODEL_NAME
+from ..config import EMBEDDING_MODEL_NAME, EMBEDDING_THREADS, EMBEDDING_DEVICE
 
 # Global embedding model (lazy loaded)
 _EMBEDDING_MODEL: Optional[Any] = None
@@ -14,8 +13,16 @@ def get_embedding_model() -> Any:
     """Lazy load embedding model."""
     global _EMBEDDING_MODEL
     if _EMBEDDING_MODEL is None:
+        import torch
         from sentence_transformers import SentenceTransformer
 
+        # OMP_NUM_THREADS=1 would otherwise leave batched encoding on a single core
+        torch.set_num_threads(EMBEDDING_THREADS)
+
         # all-MiniLM-L6-v2: fast, small (80MB), good quality
-        _EMBEDDING_MODEL = SentenceTransformer(EMBEDDING_MODEL_NAME, device='cpu')
+        model = SentenceTransformer(EMBEDDING_MODEL_NAME, device=EMBEDDING_DEVICE)
+        if model.device.type in ('cuda', 'mps'):
+            # Half precision doubles GPU throughput; this model's outputs are fp16-stable
+            model.half()
+        _EMBEDDING_MODEL = model
     return _EMBEDDING_MODEL
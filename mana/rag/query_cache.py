@@ -0,0 +1,132 @@
+"""On-disk cache of search results, kept across runs until the index changes."""
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional, falls back to stdlib json
+    orjson = None
+
+from ..config import (
+    FAISS_INDEX_FILE,
+    CHUNKS_DIR,
+    EMBEDDING_MODEL_NAME,
+    QUERY_CACHE_FILE,
+    QUERY_CACHE_MAX_ENTRIES,
+)
+
+# {'index': fingerprint, 'results': {key: results}}, loaded on first use
+_query_cache: Optional[Dict] = None
+_query_cache_dirty = False
+# Keys of results kept for this process only (e.g. searches ahead of Enter), oldest first
+_unsaved_keys: Dict[str, None] = {}
+# Searches may run on a worker thread while the cache is flushed at exit
+_query_cache_lock = threading.Lock()
+
+
+def _index_fingerprint() -> Optional[str]:
+    """Identify the saved index, so results cached against an older one are dropped."""
+    try:
+        index_stat = FAISS_INDEX_FILE.stat()
+        chunks_mtime = CHUNKS_DIR.stat().st_mtime_ns
+    except OSError:
+        return None
+    return f"{EMBEDDING_MODEL_NAME}:{index_stat.st_mtime_ns}:{index_stat.st_size}:{chunks_mtime}"
+
+
+def _cache_key(query: str, top_k: int) -> str:
+    # The embedding model is uncased, so case doesn't change results
+    return f"{top_k}:{query.strip().lower()}"
+
+
+def _get_query_cache(fingerprint: str) -> Dict[str, List]:
+    """Load the on-disk cache once per process, emptying it if the index changed."""
+    global _query_cache, _query_cache_dirty
+    if _query_cache is None:
+        try:
+            with open(QUERY_CACHE_FILE, 'rb') as f:
+                raw = f.read()
+            _query_cache = orjson.loads(raw) if orjson else json.loads(raw)
+        except Exception:
+            _query_cache = {}
+        atexit.register(flush_query_cache)
+
+    if _query_cache.get('index') != fingerprint:
+        _query_cache = {'index': fingerprint, 'results': {}}
+        _unsaved_keys.clear()
+        _query_cache_dirty = True
+    return _query_cache['results']
+
+
+def get_cached_results(query: str, top_k: int, persist: bool = True) -> Optional[List[Dict[str, str]]]:
+    """Return results cached for this query against the current index, if any.
+
+    With persist, results so far kept only for this process are saved too.
+    """
+    global _query_cache_dirty
+    fingerprint = _index_fingerprint()
+    if fingerprint is None:
+        return None
+
+    with _query_cache_lock:
+        key = _cache_key(query, top_k)
+        results = _get_query_cache(fingerprint).get(key)
+        if results is not None and persist and key in _unsaved_keys:
+            del _unsaved_keys[key]
+            _query_cache_dirty = True
+    return [dict(r) for r in results] if results is not None else None
+
+
+def cache_results(query: str, top_k: int, results: List[Dict[str, str]], persist: bool = True):
+    """Remember a query's results; written to disk at exit unless persist is False."""
+    global _query_cache_dirty
+    fingerprint = _index_fingerprint()
+    if fingerprint is None:
+        return
+
+    with _query_cache_lock:
+        cache = _get_query_cache(fingerprint)
+        key = _cache_key(query, top_k)
+        # Reinsert so the oldest queries are first in line to be dropped
+        cache.pop(key, None)
+        cache[key] = results
+        _unsaved_keys.pop(key, None)
+        if persist:
+            _query_cache_dirty = True
+        else:
+            _unsaved_keys[key] = None
+            if len(_unsaved_keys) > QUERY_CACHE_MAX_ENTRIES:
+                oldest = next(iter(_unsaved_keys))
+                del _unsaved_keys[oldest]
+                del cache[oldest]
+
+
+def flush_query_cache():
+    """Write new query cache entries to disk atomically (unsaved ones are left out)."""
+    global _query_cache_dirty
+    with _query_cache_lock:
+        if not _query_cache_dirty:
+            return
+
+        saved = {k: v for k, v in _query_cache['results'].items() if k not in _unsaved_keys}
+        overflow = len(saved) - QUERY_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            for key in list(saved)[:overflow]:
+                del saved[key]
+                del _query_cache['results'][key]
+
+        data = {'index': _query_cache['index'], 'results': saved}
+        payload = orjson.dumps(data) if orjson else json.dumps(data).encode('utf-8')
+        tmp_file = QUERY_CACHE_FILE.with_suffix('.json.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, QUERY_CACHE_FILE)
+            _query_cache_dirty = False
+        except Exception:
+            pass
@@ -3,14 +3,19 @@ from __future__ import annotations
 
 import curses
 import curses.textpad
+import functools
 import os
+import select
 import subprocess
+import sys
 import time
-from typing import List, Dict, Callable, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Callable, Optional, Set
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from ..config import DEFAULT_TOP_K
-from ..init_manager import InitializationManager, InitStage
+from ..config import DEFAULT_TOP_K, SEARCH_CACHE_SIZE, SEARCH_DEBOUNCE_SECONDS, SYNCHRONIZED_OUTPUT
+from ..init_manager import InitializationManager
 
 
 def init_color_palette():
@@ -39,16 +44,104 @@ def init_color_palette():
         dim_gray = min(curses.COLOR_WHITE, num_colors - 1) if num_colors > 0 else curses.COLOR_WHITE
         medium_gray = min(curses.COLOR_WHITE, num_colors - 1) if num_colors > 0 else curses.COLOR_WHITE
 
-    # Modern color palette - blue as accent color
-    curses.init_pair(1, curses.COLOR_BLUE, -1)         # Title/headers/accents - blue
-    curses.init_pair(2, dim_gray, -1)                   # Help text - dim gray (or white in 8-color)
-    curses.init_pair(3, curses.COLOR_BLUE, -1)         # Selection text - blue
-    curses.init_pair(4, curses.COLOR_BLUE, -1)         # Search label - blue
-    curses.init_pair(5, curses.COLOR_MAGENTA, -1)      # Unused
-    curses.init_pair(6, -1, -1)                         # Program names - default terminal color
-    curses.init_pair(7, medium_gray, -1)                # Descriptions - medium gray (or white in 8-color)
-    curses.init_pair(8, curses.COLOR_RED, -1)          # Favorite star - red
-    curses.init_pair(9, curses.COLOR_YELLOW, -1)       # Spinner - yellow
+    # Modern color palette - blue as accent color, as (pair, foreground, background)
+    palette = (
+        (1, curses.COLOR_BLUE, -1),         # Title/headers/accents - blue
+        (2, dim_gray, -1),                  # Help text - dim gray (or white in 8-color)
+        (3, curses.COLOR_BLUE, -1),         # Selection text - blue
+        (4, curses.COLOR_BLUE, -1),         # Search label - blue
+        (5, curses.COLOR_MAGENTA, -1),      # Unused
+        (6, -1, -1),                        # Program names - default terminal color
+        (7, medium_gray, -1),               # Descriptions - medium gray (or white in 8-color)
+        (8, curses.COLOR_RED, -1),          # Favorite star - red
+        (9, curses.COLOR_YELLOW, -1),       # Spinner - yellow
+    )
+    for pair in palette:
+        curses.init_pair(*pair)
+
+
+# Separators between the program name and its summary in a NAME line
+_DESC_SEPARATORS = (' - ', ' – ', ' — ')
+
+
+def _clean_description(program: str, description: str) -> str:
+    """Strip the redundant "program - " prefix from a result description."""
+    prog_lower = program.lower()
+    desc_lower = description.lower()
+    # Every separator is three characters, so any match has the same length
+    if not desc_lower.startswith(tuple(prog_lower + sep for sep in _DESC_SEPARATORS)):
+        return description
+    description = description[len(prog_lower) + 3:].strip()
+    if description:
+        description = description[0].upper() + description[1:]
+    return description
+
+
+@dataclass(slots=True)
+class Result:
+    """A search result as the TUI draws it."""
+    program: str
+    description: str  # Summary without the redundant "program - " prefix
+    similarity: float = 0.0
+
+
+def _to_results(chunks: List[Dict[str, str]]) -> List[Result]:
+    """Convert result dicts from a callback into Results, once per result set."""
+    results = []
+    for chunk in chunks:
+        program = chunk.get('program', 'unknown')
+        description = _clean_description(program, chunk.get('semantic_summary', 'No description'))
+        results.append(Result(program, description, chunk.get('similarity', 0.0)))
+    return results
+
+
+# Begin/end synchronized update (DEC private mode 2026)
+_BEGIN_SYNC = b"\x1b[?2026h"
+_END_SYNC = b"\x1b[?2026l"
+
+# Consoles where even an unknown private mode sequence isn't safe to send
+_NO_SYNC_TERMS = ('dumb', 'linux', 'eterm')
+
+
+def _use_synchronized_output() -> bool:
+    """Whether to wrap frames in synchronized-update markers."""
+    term = os.environ.get('TERM', '')
+    return SYNCHRONIZED_OUTPUT and sys.stdout.isatty() and not term.startswith(_NO_SYNC_TERMS)
+
+
+@functools.lru_cache(maxsize=4)
+def _progress_bar(bar_width: int, percent: int) -> str:
+    """Progress bar text, built once per width and percentage rather than per frame."""
+    filled = int((bar_width * percent) / 100)
+    bar = "█" * filled + "░" * (bar_width - filled)
+    return f"[{bar}] {percent}%"
+
+
+# Help lines for the bottom of the screen
+_SEARCH_HELP = "/ search  │  v favorites  │  m mark  │  ↑↓ navigate  │  ⏎ view  │  q quit"
+_FAVORITES_HELP = "v back  │  m unmark  │  ↑↓ navigate  │  ⏎ view  │  q quit"
+_INIT_HELP = "Initializing...  │  q quit"
+
+# Smallest screen the full layout fits; below it only a notice is drawn
+_MIN_HEIGHT = 8
+_MIN_WIDTH = 40
+_TOO_SMALL_MSG = "Terminal too small - enlarge it or press q"
+
+
+def _textbox_key(ch: int) -> Optional[int]:
+    """Map a key read during search input to a Textbox command.
+
+    Returns None to cancel the search, 0 to ignore the key.
+    """
+    if ch == -1:
+        return 0
+    if ch == 27 or ch == curses.KEY_DOWN:
+        return None
+    if ch == 127 or ch == 8:
+        return curses.KEY_BACKSPACE
+    if ch == curses.KEY_ENTER:
+        return 10  # ^J ends a one-line Textbox
+    return ch
 
 
 def run_tui(
@@ -56,9 +149,10 @@ def run_tui(
     initial_results: List[Dict[str, str]] = None,
     top_k: int = DEFAULT_TOP_K,
     search_fn: Callable[[str, int], List[Dict[str, str]]] = None,
-    is_favorite_fn: Callable[[str], bool] = None,
+    prefetch_fn: Callable[[str, int], List[Dict[str, str]]] = None,
     toggle_favorite_fn: Callable[[str], None] = None,
     get_favorites_fn: Callable[[], List[Dict[str, str]]] = None,
+    get_favorite_names_fn: Callable[[], Set[str]] = None,
     init_manager: Optional[InitializationManager] = None,
     model_ready_event: Optional['threading.Event'] = None,
     model_loading_error: Optional[list] = None
@@ -70,9 +164,16 @@ def run_tui(
         initial_results: Initial search results to display
         top_k: Number of results to return per search
         search_fn: Search callback function(query, top_k) -> results
-        is_favorite_fn: Check if program is favorited callback(program) -> bool
+        prefetch_fn: Search callback for queries searched ahead of Enter while
+            typing pauses, function(query, top_k) -> results (optional; defaults
+            to search_fn, otherwise search_fn is still called once Enter is pressed)
         toggle_favorite_fn: Toggle favorite status callback(program) -> None
+            (optional; without it favorites are not persisted)
         get_favorites_fn: Get all favorites as results callback() -> results
+            (optional; defaults to no favorites)
+        get_favorite_names_fn: Get all favorite program names callback() -> set
+            (optional; lets favorite stars be drawn without fetching every favorite
+            as a result until the favorites view is opened)
         init_manager: Optional initialization manager for background loading
 
     Note: The database index must already exist before calling this function,
@@ -80,21 +181,16 @@ def run_tui(
     """
     if search_fn is None:
         raise ValueError("search_fn callback is required")
-    if is_favorite_fn is None:
-        raise ValueError("is_favorite_fn callback is required")
     if toggle_favorite_fn is None:
-        raise ValueError("toggle_favorite_fn callback is required")
+        toggle_favorite_fn = lambda program: None
     if get_favorites_fn is None:
-        raise ValueError("get_favorites_fn callback is required")
-    import threading
-    from queue import Queue, Empty
-    import time
+        get_favorites_fn = lambda: []
 
     def main_loop(stdscr):
         # Initialize color palette based on terminal capabilities
         init_color_palette()
 
-        results = initial_results or []
+        results = _to_results(initial_results or [])
         selected_idx = 0
         prev_selected_idx = -1  # Track previous selection for partial updates
         current_page = 0
@@ -104,81 +200,157 @@ def run_tui(
         spinner_idx = 0
         needs_redraw = True  # Track if screen needs redrawing
         needs_full_redraw = True  # Track if we need a full clear vs partial update
+        # Favorites as results (None until fetched) and as a set, so drawing
+        # a row needs no callback
+        fav_results = None
+        fav_set = set()
+
+        def load_favorites():
+            """Refetch favorites, as names only if the caller can list them cheaply."""
+            nonlocal fav_results, fav_set
+            if get_favorite_names_fn is not None:
+                fav_results = None
+                fav_set = set(get_favorite_names_fn())
+            else:
+                fav_results = _to_results(get_favorites_fn())
+                fav_set = {r.program for r in fav_results}
+
+        load_favorites()
+
+        # Search view (results, selected_idx) while favorites are shown
+        saved_search_state = None
+
+        # Searches run on a single worker thread, so they never overlap and a
+        # search queued behind a prefetch of the same query finds it cached;
+        # search_cache is only ever touched from that thread
+        search_executor = ThreadPoolExecutor(max_workers=1)
+        search_future = None
+
+        # Recent searches, least recently used first
+        search_cache = {}
+
+        def cached_search(q, k, prefetch=False):
+            # The embedding model is uncased, so case doesn't change results
+            key = (q.strip().lower(), k)
+            # (results, True if only prefetch_fn has searched q)
+            hit = search_cache.pop(key, None)
+            if hit is None or (hit[1] and not prefetch):
+                fn = prefetch_fn if prefetch and prefetch_fn is not None else search_fn
+                hit = (_to_results(fn(q, k)), fn is not search_fn)
+                if len(search_cache) >= SEARCH_CACHE_SIZE:
+                    search_cache.pop(next(iter(search_cache)))
+            search_cache[key] = hit
+            return hit[0]
+
+        def prefetch_search(q):
+            """Search q in the background so pressing Enter finds it cached."""
+            q = q.strip()
+            if q and (model_ready_event is None or model_ready_event.is_set()):
+                search_executor.submit(cached_search, q, top_k, True)
 
         # For async search
         search_in_progress = False
-        search_queue = Queue()
-        search_thread = None
-
-        # Helper function to draw a single result line
-        def draw_result_line(y, result_idx, is_selected, width):
-            """Draw a single result line at position y."""
-            if result_idx >= len(results):
-                # Clear the line if no result
-                stdscr.move(y, 0)
-                stdscr.clrtoeol()
-                return
 
-            chunk = results[result_idx]
-            program = chunk.get('program', 'unknown')
-            description = chunk.get('semantic_summary', 'No description')
-
-            # Strip redundant program name from description
-            desc_lower = description.lower()
-            prog_lower = program.lower()
-            for separator in [' - ', ' – ', ' — ']:
-                prefix = prog_lower + separator
-                if desc_lower.startswith(prefix):
-                    description = description[len(prefix):].strip()
-                    if description:
-                        description = description[0].upper() + description[1:]
-                    break
+        # One-line window search input is edited in, kept across searches
+        input_win = None
+        input_box = None
+
+        # Row attributes, combined once rather than per drawn row
+        row_normal = curses.color_pair(0)
+        row_selected = curses.color_pair(3)
+        row_selected_bold = row_selected | curses.A_BOLD
+        row_program = curses.color_pair(6) | curses.A_BOLD
+        row_desc = curses.color_pair(7)
+        row_star = curses.color_pair(8)
+
+        # Attributes for the rest of the frame
+        title_attr = curses.color_pair(1) | curses.A_BOLD
+        dim_attr = curses.color_pair(2)
+        label_attr = curses.color_pair(4) | curses.A_BOLD
+        spinner_attr = curses.color_pair(9)
+        spinner_bold = spinner_attr | curses.A_BOLD
+
+        # Every result row lives in a pad, painted when the results change;
+        # a page is shown by copying its slice of the pad to the screen
+        results_pad = None
+        pad_results = None
+        pad_width = -1
+        pad_selected = -1
 
-            is_fav = is_favorite_fn(program)
+        # Helper function to draw a single result line
+        def draw_result_line(result_idx, is_selected):
+            """Draw a single result line into a freshly created (blank) pad.
 
-            # Clear the line first
-            stdscr.move(y, 0)
-            stdscr.clrtoeol()
+            Blank cells are left alone, so a typical row takes two writes.
+            """
+            y = result_idx
+            result = results[result_idx]
+            program = result.program
+            addstr = results_pad.addstr
 
             # Draw cursor
             if is_selected:
-                cursor = "▶ "
-                stdscr.addstr(y, 2, cursor, curses.color_pair(3) | curses.A_BOLD)
-            else:
-                stdscr.addstr(y, 2, "  ", curses.color_pair(0))
+                addstr(y, 2, "▶ ", row_selected_bold)
 
             # Draw star
-            star_x = 4
-            if is_fav:
-                stdscr.addstr(y, star_x, "★ ", curses.color_pair(8))
-            else:
-                stdscr.addstr(y, star_x, "  ", curses.color_pair(0))
+            if program in fav_set:
+                addstr(y, 4, "★ ", row_star)
 
-            # Draw program name
-            prog_x = 6
-            prog_color = curses.color_pair(3) if is_selected else curses.color_pair(6)
-            stdscr.addstr(y, prog_x, program, prog_color | curses.A_BOLD)
+            # Draw program name, clipped so a long one can't wrap into the next row
+            # (_MIN_WIDTH keeps room for descriptions, which start at x=30)
+            results_pad.addnstr(y, 6, program, pad_width - 6 - 2,
+                                row_selected_bold if is_selected else row_program)
 
             # Draw description
-            desc_x = prog_x + 24
-            desc_text = description[:width - desc_x - 2]
-            desc_color = curses.color_pair(3) if is_selected else curses.color_pair(7)
-            stdscr.addstr(y, desc_x, desc_text, desc_color)
-
-        # Use provided model_ready_event and model_loading_error for model status
-        def start_search(q, query, top_k):
-            # Wait for model to be ready before searching
-            if model_ready_event is not None:
-                while not model_ready_event.is_set():
-                    time.sleep(0.1)
-                if model_loading_error is not None and len(model_loading_error) > 0 and model_loading_error[0] is not None:
-                    q.put([])
-                    return
-            try:
-                res = search_fn(query, top_k)
-                q.put(res)
-            except Exception as e:
-                q.put([])
+            if result.description:
+                results_pad.addnstr(y, 30, result.description, pad_width - 30 - 2,
+                                    row_selected if is_selected else row_desc)
+
+        def restyle_result_line(result_idx, is_selected):
+            """Switch a painted line between selected and normal, changing only attributes."""
+            y = result_idx
+            results_pad.addstr(y, 2, "▶ " if is_selected else "  ", row_selected_bold if is_selected else row_normal)
+            results_pad.chgat(y, 6, 24, row_selected_bold if is_selected else row_program)
+            results_pad.chgat(y, 30, row_selected if is_selected else row_desc)
+
+        def update_pad(width):
+            """Repaint the pad if the results or width changed, else just move the selection."""
+            nonlocal results_pad, pad_results, pad_width, pad_selected
+            if results_pad is None or pad_results is not results or pad_width != width:
+                results_pad = curses.newpad(max(1, n_results), width)
+                pad_results = results
+                pad_width = width
+                for result_idx in range(n_results):
+                    draw_result_line(result_idx, result_idx == selected_idx)
+            elif pad_selected != selected_idx:
+                if pad_selected < n_results:
+                    restyle_result_line(pad_selected, False)
+                restyle_result_line(selected_idx, True)
+            pad_selected = selected_idx
+
+        def show_page(width):
+            """Stage the current page of the pad for the next doupdate()."""
+            page_start = current_page * page_size
+            visible = min(page_size, n_results - page_start)
+            if visible > 0:
+                results_pad.noutrefresh(page_start, 0, list_start_y, 0, list_start_y + visible - 1, width - 1)
+
+        addstr = stdscr.addstr
+
+        sync_output = _use_synchronized_output()
+        out_fd = sys.stdout.fileno()
+
+        def flush_frame():
+            """Send the staged frame, as one synchronized update where enabled."""
+            if sync_output:
+                os.write(out_fd, _BEGIN_SYNC)
+                curses.doupdate()
+                os.write(out_fd, _END_SYNC)
+            else:
+                curses.doupdate()
+
+        # Saved so the terminal can be handed back after running man
+        curses.def_prog_mode()
 
         # Hide cursor by default
         try:
@@ -186,113 +358,368 @@ def run_tui(
         except curses.error:
             pass
             
-        # Set non-blocking input for spinner animation
-        stdscr.nodelay(True)
-        stdscr.timeout(100)  # 100ms timeout for getch()
+        # Pagination, recomputed only when the results or the height change
+        list_start_y = 4
+        page_size = 0
+        n_results = 0
+        total_pages = 0
+        prev_height = -1
+        size_changed = True  # Set on KEY_RESIZE, so getmaxyx() isn't called per frame
+        rule = ""  # Horizontal rule across the screen, rebuilt when the width changes
+
+        def update_paging():
+            nonlocal n_results, total_pages
+            n_results = len(results)
+            total_pages = (n_results + page_size - 1) // page_size if page_size > 0 else 1  # Ceiling division
+
+        def select_result(idx):
+            """Select result idx and show its page; returns True if the page changed."""
+            nonlocal selected_idx, current_page
+            old_page = current_page
+            selected_idx = idx
+            current_page = idx // page_size if page_size > 0 else 0
+            return current_page != old_page
+
+        def draw_header(width, status):
+            """Draw the title, the init status or result count, and the rule below."""
+            nonlocal spinner_idx
+            # Draw title with icon
+            title = "★ Favorites" if viewing_favorites else "◉ mana"
+            addstr(0, 2, title, title_attr)
+
+            # Draw initialization status or count in top right
+            if status is not None:
+                spinner = spinner_chars[spinner_idx % len(spinner_chars)]
+                status_text = f"{spinner} {status.message}"
+                addstr(0, width - len(status_text) - 2, status_text, spinner_attr)
+                spinner_idx += 1
+            elif results:
+                count_text = f"{n_results} results"
+                addstr(0, width - len(count_text) - 2, count_text, dim_attr)
+
+            # Draw horizontal line under the header (using hyphens for ligature support)
+            addstr(1, 0, rule, dim_attr)
+
+        def draw_init_status(height, width, status):
+            """Draw the centered initialization message and progress bar."""
+            center_y = height // 2
+
+            # Draw spinner and main message
+            spinner = spinner_chars[spinner_idx % len(spinner_chars)]
+            main_msg = f"{spinner}  {status.message}"
+            msg_x = max(2, (width - len(main_msg)) // 2)
+            addstr(center_y, msg_x, main_msg, spinner_bold)
+
+            # Draw progress bar if we have progress info
+            if status.total > 0:
+                bar_width = min(60, width - 10)
+                bar_x = (width - bar_width) // 2
+                percent = int((status.current / status.total) * 100)
+                addstr(center_y + 2, bar_x, _progress_bar(bar_width, percent), dim_attr)
+
+                # Show detail message below if available
+                if status.current > 0:
+                    detail = f"{status.current}/{status.total}"
+                    detail_x = (width - len(detail)) // 2
+                    addstr(center_y + 3, detail_x, detail, row_desc)
+
+        def draw_search_box(width):
+            """Draw the search label and current query."""
+            search_label = "› "
+            addstr(2, 2, search_label, label_attr)
+            query_text = query if query else "(press / to search)"
+            query_color = row_normal if query else dim_attr
+            stdscr.addnstr(2, 2 + len(search_label), query_text, max(0, width - 6 - len(search_label)), query_color)
+
+        def draw_footer(height, width, help_text):
+            """Draw the bottom border and help text."""
+            addstr(height - 2, 0, rule, dim_attr)
+            stdscr.addnstr(height - 1, 2, help_text, max(0, width - 4), dim_attr)
+
+        # Key handlers, dispatched by key code; a handler returns True to quit
+        def handle_quit(key):
+            return True
+
+        def handle_toggle_view(key):
+            nonlocal viewing_favorites, fav_results, fav_set, results, selected_idx
+            nonlocal saved_search_state, needs_redraw, needs_full_redraw
+            viewing_favorites = not viewing_favorites
+            if viewing_favorites:
+                # Remember the search view so coming back restores it as it was
+                saved_search_state = (results, selected_idx)
+                if fav_results is None:
+                    fav_results = _to_results(get_favorites_fn())
+                    fav_set = {r.program for r in fav_results}
+                results = fav_results
+                selected_idx = 0
+            elif saved_search_state is not None:
+                results, selected_idx = saved_search_state
+                saved_search_state = None
+            elif query:
+                # On the search worker, which a prefetch may be using
+                results = search_executor.submit(cached_search, query, top_k).result()
+                selected_idx = 0
+            else:
+                results = []
+                selected_idx = 0
+            update_paging()
+            select_result(selected_idx)
+            needs_redraw = True
+            needs_full_redraw = True
+
+        def handle_mark(key):
+            nonlocal fav_results, pad_results, results, needs_redraw, needs_full_redraw
+            if not results or not 0 <= selected_idx < n_results:
+                return
+            program = results[selected_idx].program
+            if not program:
+                return
+            toggle_favorite_fn(program)
+            fav_set.symmetric_difference_update((program,))
+            fav_results = None
+            pad_results = None  # Repaint the star
+            if viewing_favorites:
+                results = fav_results = _to_results(get_favorites_fn())
+                update_paging()
+                select_result(max(0, min(selected_idx, n_results - 1)))
+                needs_full_redraw = True
+            # Just redraw the current line to update the star
+            needs_redraw = True
 
+        def handle_search(key):
+            nonlocal query, search_in_progress, spinner_idx, size_changed, needs_redraw, needs_full_redraw
+            nonlocal input_win, input_box, input_timeout
+            if viewing_favorites:
+                return
+            curses.noecho()
+            try:
+                curses.curs_set(1)  # Show cursor during input
+            except curses.error:
+                pass  # Some terminals don't support cursor visibility control
+            addstr(2, 2, " " * (width - 4))
+            addstr(2, 2, "› ", label_attr)
+            stdscr.noutrefresh()
+            curses.doupdate()
+
+            if input_win is None or input_win.getmaxyx()[1] != width - 8:
+                input_win = curses.newwin(1, width - 8, 2, 4)
+                input_box = curses.textpad.Textbox(input_win, insert_mode=True)
+            else:
+                input_win.erase()
+                input_win.move(0, 0)
+            box = input_box
+            if key != ord('/') and key != ord('s'):
+                box.do_command(key)
+            input_win.noutrefresh()
+            curses.doupdate()
+
+            # getch() must time out so a pause in typing can be noticed
+            stdscr.timeout(100)
+            input_timeout = 100
+
+            # Textbox does the editing, but keys are read through stdscr, which
+            # stays untouched, so getch() doesn't repaint; input_win is flushed
+            # once typeahead is drained rather than per key as Textbox.edit() would
+            edited_at = None  # Time of the last edit not yet prefetched
+            while True:
+                ch = stdscr.getch()
+                if ch == curses.KEY_RESIZE:
+                    size_changed = True  # Laid out again once input ends
+                ch = _textbox_key(ch)
+                if ch is None:
+                    new_query = None
+                    break
+                if ch and not box.do_command(ch):
+                    new_query = box.gather()
+                    break
+                if ch:
+                    edited_at = time.monotonic()
+                elif edited_at is not None and time.monotonic() - edited_at >= SEARCH_DEBOUNCE_SECONDS:
+                    # getch() timed out and typing has paused: search ahead.
+                    # gather() leaves the cursor after the last non-blank, so put it
+                    # back or a trailing space would be typed over
+                    y, x = input_win.getyx()
+                    prefetch_search(box.gather())
+                    input_win.move(y, x)
+                    edited_at = None
+                if not select.select([sys.stdin], [], [], 0)[0]:
+                    input_win.noutrefresh()
+                    curses.doupdate()
+
+            curses.noecho()
+            try:
+                curses.curs_set(0)  # Hide cursor again
+            except curses.error:
+                pass  # Some terminals don't support cursor visibility control
+
+            # Only update if we didn't cancel
+            if new_query is not None and new_query.strip():
+                query = new_query.strip()
+                # The main loop submits the search and polls for its results
+                search_in_progress = True
+                spinner_idx = 0
+            # Redraw whether searching or canceled
+            needs_redraw = True
+            needs_full_redraw = True
+
+        def handle_down(key):
+            nonlocal needs_redraw, needs_full_redraw
+            if not results:
+                return handle_other(key)
+            # Wraps from the last item to the first;
+            # a selection change on the same page is drawn by the partial update
+            if select_result((selected_idx + 1) % n_results):
+                needs_redraw = True
+                needs_full_redraw = True
+
+        def handle_up(key):
+            nonlocal needs_redraw, needs_full_redraw
+            if not results:
+                return handle_other(key)
+            # Wraps from the first item to the last
+            if select_result((selected_idx - 1) % n_results):
+                needs_redraw = True
+                needs_full_redraw = True
+
+        def handle_next_page(key):
+            nonlocal needs_redraw, needs_full_redraw
+            if not results:
+                return handle_other(key)
+            if current_page < total_pages - 1:
+                # Move selection to first item on new page
+                select_result((current_page + 1) * page_size)
+                needs_redraw = True
+                needs_full_redraw = True  # Page change always needs full redraw
+
+        def handle_prev_page(key):
+            nonlocal needs_redraw, needs_full_redraw
+            if not results:
+                return handle_other(key)
+            if current_page > 0:
+                # Move selection to first item on new page
+                select_result((current_page - 1) * page_size)
+                needs_redraw = True
+                needs_full_redraw = True  # Page change always needs full redraw
+
+        def handle_view(key):
+            nonlocal size_changed, needs_redraw, needs_full_redraw
+            # View man page
+            if not results or not 0 <= selected_idx < n_results:
+                return
+            program = results[selected_idx].program
+            if program:
+                curses.endwin()
+                # Clear screen before showing man page to avoid flash
+                sys.stdout.write("\x1b[2J\x1b[H")
+                sys.stdout.flush()
+                subprocess.run(["man", program])
+                # Back to the saved program mode; colors survive endwin()
+                curses.reset_prog_mode()
+                # The terminal no longer shows what curses last drew, and may
+                # have been resized while man had it
+                stdscr.clear()
+                size_changed = True
+                needs_redraw = True
+                needs_full_redraw = True
+
+        def handle_resize(key):
+            nonlocal size_changed, needs_redraw, needs_full_redraw
+            size_changed = True
+            needs_redraw = True
+            needs_full_redraw = True
+
+        def handle_other(key):
+            # With nothing listed, typing starts a search (even with movement keys)
+            if not results and 32 <= key <= 126:
+                handle_search(key)
+
+        handlers = {
+            ord('q'): handle_quit,
+            ord('v'): handle_toggle_view,
+            ord('m'): handle_mark,
+            ord('/'): handle_search, ord('s'): handle_search,
+            curses.KEY_DOWN: handle_down, ord('j'): handle_down, ord('n'): handle_down,
+            curses.KEY_UP: handle_up, ord('k'): handle_up, ord('p'): handle_up,
+            curses.KEY_RIGHT: handle_next_page, ord('l'): handle_next_page, ord('f'): handle_next_page,
+            curses.KEY_LEFT: handle_prev_page, ord('h'): handle_prev_page, ord('b'): handle_prev_page,
+            ord('\n'): handle_view, curses.KEY_ENTER: handle_view,
+            curses.KEY_RESIZE: handle_resize,
+        }
+
+        # getch() timeout, switched between blocking and polling by the main loop
+        input_timeout = None
+
+        is_initializing = False
         while True:
-            height, width = stdscr.getmaxyx()
+            if size_changed:
+                size_changed = False
+                height, width = stdscr.getmaxyx()
+            if height != prev_height:
+                prev_height = height
+                page_size = height - 6  # Leave space for bottom border and help text
+                update_paging()
+                select_result(selected_idx)  # Keep the selection on screen
+                needs_redraw = True
+                needs_full_redraw = True
+            if len(rule) != width:
+                rule = "-" * width
 
             # Check if we're still initializing
-            was_initializing = is_initializing if 'is_initializing' in locals() else False
+            was_initializing = is_initializing
             is_initializing = init_manager and not init_manager.is_complete() and not init_manager.is_error()
 
             # If initialization just completed, trigger a full redraw
             if was_initializing and not is_initializing:
+                # The index changed, and favorites only resolve against it once it exists
+                # Queued behind any running search, which would re-add stale results
+                search_executor.submit(search_cache.clear)
+                saved_search_state = None
+                load_favorites()
                 needs_redraw = True
                 needs_full_redraw = True
 
+            # With keys still queued (e.g. a held j/k autorepeating), handle them
+            # all first and draw once for the lot
+            typeahead = bool(select.select([sys.stdin], [], [], 0)[0])
+
             # Only redraw if needed or if animations are active
-            if needs_redraw or is_initializing or search_in_progress:
-                # Full clear only when necessary (but always clear during init/search for changing messages)
+            too_small = height < _MIN_HEIGHT or width < _MIN_WIDTH
+            if typeahead and not is_initializing:
+                pass
+            elif too_small:
+                # Skip the layout entirely; the resize that fixes this forces a full redraw
+                if needs_redraw:
+                    stdscr.erase()
+                    # Stay off the last column, as writing the bottom-right cell fails
+                    stdscr.addnstr(0, 0, _TOO_SMALL_MSG, max(0, width - 1))
+                    flush_frame()
+                    needs_redraw = False
+            elif needs_redraw or is_initializing or search_in_progress:
+                # Blank the virtual screen only (never clear(), which forces a full
+                # repaint); doupdate() then sends just the cells that differ
                 if needs_full_redraw or is_initializing or search_in_progress:
-                    stdscr.clear()
+                    stdscr.erase()
                     needs_full_redraw = False
                 needs_redraw = False  # Reset flag after clearing
 
-                # Draw title with icon
-                if viewing_favorites:
-                    title = "★ Favorites"
-                    stdscr.addstr(0, 2, title, curses.color_pair(1) | curses.A_BOLD)
-                else:
-                    title = "◉ mana"
-                    stdscr.addstr(0, 2, title, curses.color_pair(1) | curses.A_BOLD)
-
-                # Draw initialization status or count in top right
-                if is_initializing and init_manager:
-                    status = init_manager.get_status()
-                    spinner = spinner_chars[spinner_idx % len(spinner_chars)]
-                    status_text = f"{spinner} {status.message}"
-                    stdscr.addstr(0, width - len(status_text) - 2, status_text, curses.color_pair(9))
-                    spinner_idx += 1
-                elif results:
-                    count_text = f"{len(results)} results"
-                    stdscr.addstr(0, width - len(count_text) - 2, count_text, curses.color_pair(2))
-
-                # Draw horizontal line under the header (using hyphens for ligature support)
-                stdscr.addstr(1, 0, "-" * width, curses.color_pair(2))
-
-                # Draw bottom border
-                stdscr.addstr(height - 2, 0, "-" * width, curses.color_pair(2))
-
-                # If initializing, show status message in center
-                if is_initializing and init_manager:
-                    status = init_manager.get_status()
-
-                    # Center status messages
-                    center_y = height // 2
-
-                    # Draw spinner and main message
-                    spinner = spinner_chars[spinner_idx % len(spinner_chars)]
-                    main_msg = f"{spinner}  {status.message}"
-                    msg_x = max(2, (width - len(main_msg)) // 2)
-                    stdscr.addstr(center_y, msg_x, main_msg, curses.color_pair(9) | curses.A_BOLD)
-
-                    # Draw progress bar if we have progress info
-                    if status.total > 0:
-                        bar_width = min(60, width - 10)
-                        bar_x = (width - bar_width) // 2
-                        percent = int((status.current / status.total) * 100)
-                        filled = int((bar_width * percent) / 100)
-                        bar = "█" * filled + "░" * (bar_width - filled)
-                        bar_text = f"[{bar}] {percent}%"
-                        stdscr.addstr(center_y + 2, bar_x, bar_text, curses.color_pair(2))
-
-                        # Show detail message below if available
-                        if status.current > 0 and status.total > 0:
-                            detail = f"{status.current}/{status.total}"
-                            detail_x = (width - len(detail)) // 2
-                            stdscr.addstr(center_y + 3, detail_x, detail, curses.color_pair(7))
-
-                    # Help text for initializing state
-                    help_text = "Initializing...  │  q quit"
-                    stdscr.addstr(height - 1, 2, help_text[:width-4], curses.color_pair(2))
+                status = init_manager.get_status() if is_initializing else None
+                draw_header(width, status)
+                if status is not None:
+                    draw_init_status(height, width, status)
+                    draw_footer(height, width, _INIT_HELP)
                 else:
                     # Normal UI - draw search box with padding (only in search mode)
                     if not viewing_favorites:
-                        search_label = "› "
-                        stdscr.addstr(2, 2, search_label, curses.color_pair(4) | curses.A_BOLD)
-                        query_text = query if query else "(press / to search)"
-                        query_color = curses.color_pair(0) if query else curses.color_pair(2)
-                        stdscr.addstr(2, 2 + len(search_label), query_text[:width - 6 - len(search_label)], query_color)
+                        draw_search_box(width)
 
                     # If search is in progress, show spinner and message
                     if search_in_progress:
                         spinner = spinner_chars[spinner_idx % len(spinner_chars)]
                         msg = f"{spinner} Searching..."
                         msg_x = max(2, (width - len(msg)) // 2)
-                        stdscr.addstr(height // 2, msg_x, msg, curses.color_pair(9) | curses.A_BOLD)
-
-                    # Draw help text with modern look
-                    if viewing_favorites:
-                        help_text = "v back  │  m unmark  │  ↑↓ navigate  │  ⏎ view  │  q quit"
-                    else:
-                        help_text = "/ search  │  v favorites  │  m mark  │  ↑↓ navigate  │  ⏎ view  │  q quit"
-                    stdscr.addstr(height - 1, 2, help_text[:width-4], curses.color_pair(2))
+                        addstr(height // 2, msg_x, msg, spinner_bold)
 
-                # Calculate list area with padding (avoid bottom border)
-                list_start_y = 4
-                list_height = height - 6  # Leave space for bottom border and help text
+                    draw_footer(height, width, _FAVORITES_HELP if viewing_favorites else _SEARCH_HELP)
 
                 # Draw results with pagination (only when not initializing or searching)
                 if is_initializing or search_in_progress:
@@ -302,58 +729,41 @@ def run_tui(
                     # Just show empty space when no results
                     pass
                 else:
-                    page_size = list_height
-                    total_pages = (len(results) + page_size - 1) // page_size  # Ceiling division
                     current_page = max(0, min(current_page, total_pages - 1))
 
-                    page_start = current_page * page_size
-                    page_end = min(page_start + page_size, len(results))
-
                     # Draw page indicator if multiple pages
                     if total_pages > 1:
                         page_info = f"page {current_page + 1}/{total_pages}"
-                        stdscr.addstr(0, width - len(page_info) - 15, page_info, curses.color_pair(2))
+                        addstr(0, width - len(page_info) - 15, page_info, dim_attr)
 
-                    for i in range(page_size):
-                        result_idx = page_start + i
-                        if result_idx >= page_end:
-                            break
-                        y = list_start_y + i
-                        is_selected = result_idx == selected_idx
-                        draw_result_line(y, result_idx, is_selected, width)
+                    update_pad(width)
+                    # stdscr was erased underneath, so the whole page must be copied
+                    results_pad.touchwin()
 
-                stdscr.refresh()
+                stdscr.noutrefresh()
+                if results and not is_initializing and not search_in_progress:
+                    show_page(width)
+                flush_frame()
 
-            # Handle partial updates for navigation (when only selection changed)
-            # This eliminates flicker by only redrawing the two affected lines
+            # Handle partial updates for navigation (when only selection changed):
+            # repaint the two affected pad lines and copy the page to the screen
             elif not is_initializing and not search_in_progress and results:
-                list_start_y = 4
-                list_height = height - 6
-                page_size = list_height
-                page_start = current_page * page_size
-
-                # Check if only the selection changed (no full redraw needed)
                 if prev_selected_idx != selected_idx and prev_selected_idx != -1:
-                    # Both selections are on the same page
-                    prev_page = prev_selected_idx // page_size
-                    curr_page = selected_idx // page_size
-
-                    if prev_page == curr_page == current_page:
-                        # Redraw only the two affected lines
-                        if prev_selected_idx >= page_start and prev_selected_idx < page_start + page_size:
-                            prev_y = list_start_y + (prev_selected_idx - page_start)
-                            draw_result_line(prev_y, prev_selected_idx, False, width)
-
-                        if selected_idx >= page_start and selected_idx < page_start + page_size:
-                            curr_y = list_start_y + (selected_idx - page_start)
-                            draw_result_line(curr_y, selected_idx, True, width)
-
-                        stdscr.refresh()
+                    update_pad(width)
+                    show_page(width)
+                    flush_frame()
 
             # Update previous selection for next iteration
-            if selected_idx != prev_selected_idx:
+            if selected_idx != prev_selected_idx and not typeahead:
                 prev_selected_idx = selected_idx
 
+            # Block until a key (or resize) arrives when nothing is animating;
+            # poll every 100ms for the spinners, search results and init progress
+            wanted_timeout = 100 if is_initializing or search_in_progress else -1
+            if wanted_timeout != input_timeout:
+                stdscr.timeout(wanted_timeout)
+                input_timeout = wanted_timeout
+
             # Handle input and search thread
             try:
                 key = stdscr.getch()
@@ -364,192 +774,54 @@ def run_tui(
             if is_initializing:
                 if key == ord('q'):
                     break
+                if key == curses.KEY_RESIZE:
+                    handle_resize(key)
                 continue
 
-            # If search is in progress, check for results
+            # If search is in progress, check for results; meanwhile only allow quit
             if search_in_progress:
-                try:
-                    new_results = search_queue.get_nowait()
-                    results = new_results
-                    search_in_progress = False
-                    selected_idx = 0
-                    current_page = 0
-                    needs_redraw = True
-                    needs_full_redraw = True
-                except Empty:
+                new_results = None
+                if search_future is None:
+                    # Wait for model to be ready before searching
+                    if model_ready_event is None or model_ready_event.is_set():
+                        if model_loading_error and model_loading_error[0] is not None:
+                            new_results = []
+                        else:
+                            search_future = search_executor.submit(cached_search, query, top_k)
+                elif search_future.done():
+                    try:
+                        new_results = search_future.result()
+                    except Exception:
+                        new_results = []
+                    search_future = None
+
+                if new_results is None:
+                    if key == ord('q'):
+                        break
+                    if key == curses.KEY_RESIZE:
+                        handle_resize(key)
                     spinner_idx += 1
                     continue
+                results = new_results
+                update_paging()
+                search_in_progress = False
+                select_result(0)
+                needs_redraw = True
+                needs_full_redraw = True
 
             # Handle -1 (no input due to timeout) - just refresh the display
             if key == -1:
                 continue
 
-            if key == ord('q'):
+            # Nothing else fits on a tiny screen, so only quit and resize apply
+            if too_small and key not in (ord('q'), curses.KEY_RESIZE):
+                continue
+
+            if handlers.get(key, handle_other)(key):
                 break
-            elif key == ord('v'):
-                viewing_favorites = not viewing_favorites
-                if viewing_favorites:
-                    results = get_favorites_fn()
-                    selected_idx = 0
-                    current_page = 0
-                else:
-                    if query:
-                        results = search_fn(query, top_k)
-                    else:
-                        results = []
-                    selected_idx = 0
-                    current_page = 0
-                needs_redraw = True
-                needs_full_redraw = True
-            elif key == ord('m'):
-                if results and 0 <= selected_idx < len(results):
-                    program = results[selected_idx].get('program', '')
-                    if program:
-                        toggle_favorite_fn(program)
-                        if viewing_favorites:
-                            results = get_favorites_fn()
-                            if selected_idx >= len(results) and results:
-                                selected_idx = len(results) - 1
-                            elif not results:
-                                selected_idx = 0
-                            needs_full_redraw = True
-                        # Just redraw the current line to update the star
-                        needs_redraw = True
-            elif key == ord('/') or key == ord('s') or (not results and key >= 32 and key <= 126):
-                if viewing_favorites:
-                    continue
-                curses.noecho()
-                try:
-                    curses.curs_set(1)  # Show cursor during input
-                except curses.error:
-                    pass  # Some terminals don't support cursor visibility control
-                stdscr.addstr(2, 2, " " * (width - 4))
-                stdscr.addstr(2, 2, "› ", curses.color_pair(4) | curses.A_BOLD)
-                stdscr.refresh()
 
-                input_win = curses.newwin(1, width - 8, 2, 4)
-                input_win.keypad(True)
-                new_query = ""
-                if key != ord('/') and key != ord('s'):
-                    new_query = chr(key)
-                    input_win.addch(chr(key))
-
-                while True:
-                    ch = input_win.getch()
-                    if ch == 27:
-                        new_query = None
-                        break
-                    elif ch == ord('\n') or ch == 10:
-                        break
-                    elif ch == curses.KEY_BACKSPACE or ch == 127 or ch == 8:
-                        if new_query:
-                            new_query = new_query[:-1]
-                            y, x = input_win.getyx()
-                            if x > 0:
-                                input_win.move(y, x - 1)
-                                input_win.delch()
-                    elif ch == curses.KEY_DOWN:
-                        new_query = None
-                        break
-                    elif 32 <= ch <= 126:
-                        new_query += chr(ch)
-                        input_win.addch(chr(ch))
-                    input_win.refresh()
-
-                del input_win
-                curses.noecho()
-                try:
-                    curses.curs_set(0)  # Hide cursor again
-                except curses.error:
-                    pass  # Some terminals don't support cursor visibility control
-
-                # Only update if we didn't cancel
-                if new_query is not None and new_query.strip():
-                    query = new_query.strip()
-                    # Start search in background thread
-                    search_in_progress = True
-                    search_thread = threading.Thread(target=start_search, args=(search_queue, query, top_k))
-                    search_thread.daemon = True
-                    search_thread.start()
-                    spinner_idx = 0
-                    needs_redraw = True
-                    needs_full_redraw = True
-                else:
-                    # User canceled search, need to redraw
-                    needs_redraw = True
-                    needs_full_redraw = True
-            elif key == curses.KEY_DOWN or key == ord('j') or key == ord('n'):
-                if results:
-                    page_size = list_height
-                    page_start = current_page * page_size
-                    page_end = min(page_start + page_size, len(results))
-
-                    old_page = current_page
-                    if selected_idx < len(results) - 1:
-                        selected_idx += 1
-                        # If we moved past the current page, go to next page
-                        if selected_idx >= page_end:
-                            current_page += 1
-                    elif selected_idx == len(results) - 1:
-                        # At the last item, wrap to first item on first page
-                        selected_idx = 0
-                        current_page = 0
-                    # Only need full redraw if page changed
-                    needs_redraw = True
-                    if old_page != current_page:
-                        needs_full_redraw = True
-            elif key == curses.KEY_UP or key == ord('k') or key == ord('p'):
-                if results:
-                    page_size = list_height
-                    page_start = current_page * page_size
-
-                    old_page = current_page
-                    if selected_idx > 0:
-                        selected_idx -= 1
-                        # If we moved before the current page, go to previous page
-                        if selected_idx < page_start:
-                            current_page -= 1
-                    elif selected_idx == 0:
-                        # At the first item, wrap to last item on last page
-                        selected_idx = len(results) - 1
-                        current_page = (len(results) - 1) // page_size
-                    # Only need full redraw if page changed
-                    needs_redraw = True
-                    if old_page != current_page:
-                        needs_full_redraw = True
-            elif key == curses.KEY_RIGHT or key == ord('l') or key == ord('f'):
-                if results:
-                    page_size = list_height
-                    total_pages = (len(results) + page_size - 1) // page_size
-                    if current_page < total_pages - 1:
-                        current_page += 1
-                        # Move selection to first item on new page
-                        selected_idx = current_page * page_size
-                        needs_redraw = True
-                        needs_full_redraw = True  # Page change always needs full redraw
-            elif key == curses.KEY_LEFT or key == ord('h') or key == ord('b'):
-                if results:
-                    page_size = list_height
-                    if current_page > 0:
-                        current_page -= 1
-                        # Move selection to first item on new page
-                        selected_idx = current_page * page_size
-                        needs_redraw = True
-                        needs_full_redraw = True  # Page change always needs full redraw
-            elif key == ord('\n') or key == curses.KEY_ENTER or key == 10:
-                # View man page
-                if results and 0 <= selected_idx < len(results):
-                    program = results[selected_idx].get('program', '')
-                    if program:
-                        curses.endwin()
-                        # Clear screen before showing man page to avoid flash
-                        os.system('clear')
-                        subprocess.run(["man", program])
-                        stdscr = curses.initscr()
-                        # Reinitialize color scheme after returning from man
-                        init_color_palette()
-                        needs_redraw = True
-                        needs_full_redraw = True
+        # Don't start queued searches; one already running finishes in the background
+        search_executor.shutdown(wait=False, cancel_futures=True)
 
     curses.wrapper(main_loop)
     